@@ -0,0 +1,276 @@
+"""
+Local JSON API for announcements.
+
+Serves the same Friday posts, SkillBuilder watch-by guides and
+end-of-LiveLab reminders the Streamlit app shows, for the Slack bot and
+LMS integrations, straight from the local schedule store (csv_data/).
+
+    python api.py                     # http://127.0.0.1:8600
+    python api.py --port 9000 --host 0.0.0.0
+
+    GET /sections                            every section + its data version
+    GET /sections/{name}                     one section: watch-by guides + full Markdown
+    GET /sections/{name}/fridays[?date=...]  Friday posts (date=YYYY-MM-DD -> that week's post only)
+    GET /sections/{name}/reminders           end-of-LiveLab reminders
+
+Every response carries an ETag (the same key as the pre-rendered artifacts:
+source CSV hash + due-date overrides, utils/edits.py and render code +
+artifact version) and a Last-Modified from those files' mtimes, so a
+conditional request (If-None-Match or If-Modified-Since) is answered 304
+without rendering anything. Handlers are
+async; rendering runs on a thread pool, once per section and data version,
+and edited CSVs are picked up on the next request.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from email.utils import parsedate_to_datetime
+
+import pandas as pd
+import tornado.web
+from tornado import httputil
+
+from functions import adjust_to_most_recent_friday, strip_streamlit_colors
+from utils.artifacts import ARTIFACT_DIR, artifact_key, load_artifact, render_inputs_mtime, render_section, save_artifact
+from utils.snapshot import CSV_DIR, SNAPSHOT_PATH, csv_fingerprint, load_snapshot
+from utils.store import ScheduleStore
+
+DEFAULT_PORT = 8600
+
+
+# -------------------------------
+# 📚 Schedules + renders shared by every request
+# -------------------------------
+class AnnouncementService:
+    """Holds the schedule store and one render per (section, data version)."""
+
+    def __init__(self, csv_dir=CSV_DIR, artifact_root=ARTIFACT_DIR):
+        self.csv_dir = csv_dir
+        self.artifact_root = artifact_root
+        self.store = None
+        self._fingerprint = None
+        self._modified = {}
+        self._renders = {}  # artifact key -> Future of the rendered dict
+        self._reload_lock = asyncio.Lock()
+
+    async def refresh(self):
+        """Reload the store if any CSV changed since the last request (a few stat calls otherwise)."""
+        loop = asyncio.get_running_loop()
+        fingerprint = await loop.run_in_executor(None, csv_fingerprint, self.csv_dir)
+        if fingerprint == self._fingerprint:
+            return
+        async with self._reload_lock:
+            if fingerprint == self._fingerprint:
+                return
+            path = os.path.join(self.csv_dir, os.path.basename(SNAPSHOT_PATH))
+            snapshot = await loop.run_in_executor(None, load_snapshot, self.csv_dir, path)
+            self.store = ScheduleStore(snapshot)
+            self._modified = {name: entry["mtime_ns"] / 1e9 for name, entry in snapshot["files"].items()}
+            self._renders.clear()
+            self._fingerprint = fingerprint
+
+    def etag(self, name):
+        return artifact_key(self.store.hashes[name])
+
+    def last_modified(self, name):
+        # the CSV, or anything else the render depends on (overrides, edits.py, render code)
+        return max(self._modified.get(name, 0), render_inputs_mtime())
+
+    def _load_or_render(self, name, key):
+        rendered = load_artifact(name, key, self.artifact_root)
+        if rendered is None:
+            rendered = render_section(name, self.store[name])
+            save_artifact(name, key, rendered, self.artifact_root)
+        return rendered
+
+    async def render(self, name):
+        """The section's render; concurrent requests for the same version share one computation."""
+        key = self.etag(name)
+        future = self._renders.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._renders[key] = asyncio.ensure_future(
+                loop.run_in_executor(None, self._load_or_render, name, key)
+            )
+        try:
+            return await future
+        except Exception:
+            self._renders.pop(key, None)
+            raise
+
+
+# -------------------------------
+# 🌐 Handlers
+# -------------------------------
+class BaseHandler(tornado.web.RequestHandler):
+    def initialize(self, service):
+        self.service = service
+
+    async def prepare(self):
+        await self.service.refresh()
+
+    def set_default_headers(self):
+        self.set_header("Content-Type", "application/json; charset=UTF-8")
+        self.set_header("Cache-Control", "no-cache")  # always revalidate; 304s are free
+
+    def compute_etag(self):
+        # ETags come from the data (set in not_modified), not from hashing the body
+        return None
+
+    def section_or_404(self, name):
+        if name not in self.service.store:
+            raise tornado.web.HTTPError(404, reason=f"Unknown section: {name}")
+        return name
+
+    def not_modified(self, etag, last_modified):
+        """Set validators; answer 304 (and return True) if the client's copy is current."""
+        self.set_header("ETag", f'"{etag}"')
+        self.set_header("Last-Modified", httputil.format_timestamp(last_modified))
+        if self.request.headers.get("If-None-Match"):
+            fresh = self.check_etag_header()
+        else:
+            fresh = _not_modified_since(self.request.headers.get("If-Modified-Since"), last_modified)
+        if fresh:
+            self.set_status(304)
+            self.finish()
+        return fresh
+
+    def write_json(self, payload):
+        self.finish(json.dumps(payload, ensure_ascii=False))
+
+    def write_error(self, status_code, **kwargs):
+        self.finish(json.dumps({"error": self._reason, "status": status_code}))
+
+
+def _not_modified_since(header, last_modified):
+    if not header:
+        return False
+    try:
+        return parsedate_to_datetime(header).timestamp() >= int(last_modified)
+    except (TypeError, ValueError):
+        return False
+
+
+class SectionsHandler(BaseHandler):
+    async def get(self):
+        store = self.service.store
+        names = list(store.names)
+        etag = hashlib.sha256("|".join(f"{name}={self.service.etag(name)}" for name in names).encode()).hexdigest()[:32]
+        if self.not_modified(etag, max((self.service.last_modified(name) for name in names), default=0)):
+            return
+        self.write_json({
+            "sections": [
+                {
+                    "name": name,
+                    "track": _first(store[name], "track"),
+                    "wave_section": _first(store[name], "wave_section"),
+                    "version": self.service.etag(name),
+                    "fridays": self.reverse_url("fridays", name),
+                    "reminders": self.reverse_url("reminders", name),
+                }
+                for name in names
+            ]
+        })
+
+
+def _first(df, column):
+    values = df[column].dropna() if column in df.columns else ()
+    return str(values.iloc[0]) if len(values) else None
+
+
+class SectionHandler(BaseHandler):
+    async def get(self, name):
+        name = self.section_or_404(name)
+        if self.not_modified(self.service.etag(name), self.service.last_modified(name)):
+            return
+        rendered = await self.service.render(name)
+        self.write_json({
+            **_header(rendered, self.service.etag(name)),
+            "watch_guides": rendered["watch_guides"],
+            "markdown": rendered["markdown"],
+        })
+
+
+class FridaysHandler(BaseHandler):
+    async def get(self, name):
+        name = self.section_or_404(name)
+        on = self.get_query_argument("date", None)
+        friday = None
+        if on is not None:
+            try:
+                friday = adjust_to_most_recent_friday(pd.Timestamp(on)).date().isoformat()
+            except ValueError:
+                raise tornado.web.HTTPError(400, reason=f"Bad date: {on!r} (expected YYYY-MM-DD)")
+        if self.not_modified(self.service.etag(name), self.service.last_modified(name)):
+            return
+        rendered = await self.service.render(name)
+        self.write_json({
+            **_header(rendered, self.service.etag(name)),
+            "fridays": [
+                {
+                    "friday": item["friday"],
+                    "title": strip_streamlit_colors(item["label"]),
+                    "error": item["error"],
+                    "markdown": item["markdown"],
+                    "post": item["post"],
+                }
+                for item in rendered["fridays"]
+                if friday is None or item["friday"] == friday
+            ],
+        })
+
+
+class RemindersHandler(BaseHandler):
+    async def get(self, name):
+        name = self.section_or_404(name)
+        if self.not_modified(self.service.etag(name), self.service.last_modified(name)):
+            return
+        rendered = await self.service.render(name)
+        self.write_json({
+            **_header(rendered, self.service.etag(name)),
+            "reminders": [
+                {
+                    "title": strip_streamlit_colors(item["label"]),
+                    "markdown": item["markdown"],
+                    "reminder": item["reminder"],
+                }
+                for item in rendered["reminders"]
+            ],
+        })
+
+
+def _header(rendered, version):
+    return {
+        "section": rendered["section"],
+        "track": rendered["track"],
+        "wave_section": rendered["wave_section"],
+        "data_hash": rendered["data_hash"],
+        "version": version,  # = the ETag
+    }
+
+
+def make_app(service=None):
+    service = service or AnnouncementService()
+    args = {"service": service}
+    return tornado.web.Application([
+        tornado.web.url(r"/sections", SectionsHandler, args, name="sections"),
+        tornado.web.url(r"/sections/([^/]+)", SectionHandler, args, name="section"),
+        tornado.web.url(r"/sections/([^/]+)/fridays", FridaysHandler, args, name="fridays"),
+        tornado.web.url(r"/sections/([^/]+)/reminders", RemindersHandler, args, name="reminders"),
+    ])
+
+
+async def main(host, port):
+    make_app().listen(port, address=host)
+    print(f"📡 Announcements API on http://{host}:{port}/sections")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Friday posts and end-of-LiveLab reminders as JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    args = parser.parse_args()
+    asyncio.run(main(args.host, args.port))
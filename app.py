@@ -1,37 +1,43 @@
 import streamlit as st
 import pandas as pd
-import gspread
-from gspread_dataframe import get_as_dataframe
-from oauth2client.service_account import ServiceAccountCredentials
-from google.oauth2.service_account import Credentials
-import os
-import json
+import time
 
 from functions import (
-    clean_and_parse_date,
-    add_ordinal_suffix,
-    get_milestone_due_days,
     adjust_to_most_recent_friday,
-    generate_friday_messages,
-    get_fridays_between,
-    split_by_part_ll_reset,          
-    build_watch_markdown_part1,     
-    build_watch_markdown_part2,
-    render_end_of_livelab_reminders      
+    schedule_hash,
+    plan_week_across_sections,
+    week_summary_frame,
+    friday_post_blocks,
+    friday_post_error,
+    render_post_blocks,
 )
+from utils.artifacts import artifact_key, load_artifact, paint_announcements, paint_reminders, render_section, save_artifact
+from utils.sheets import SheetsCache, SheetsConnection, SheetsFetcher
+from utils.snapshot import csv_fingerprint, load_snapshot
+from utils.store import ScheduleStore
+from utils import timing
 
 # -------------------------------
 # 🔧 App Config
 # -------------------------------
 st.set_page_config(page_icon='books', page_title="Instructor Resource Hub", layout="wide")
+run = timing.start_run()
+# section frames are views of one shared store; any write copies instead of leaking across sessions
+pd.set_option("mode.copy_on_write", True)
 
 
 # -------------------------------
-# 📂 Get list of available local CSVs
+# 📂 Shared local schedule store (one parse per process, read-only)
 # -------------------------------
-local_csvs = [
-    f.replace(".csv", "") for f in os.listdir("csv_data") if f.endswith(".csv")
-]
+@st.cache_resource(max_entries=1)
+def load_local_schedules(fingerprint):
+    # `fingerprint` only keys the cache: any CSV edit yields a new one and a rebuild
+    return ScheduleStore(load_snapshot())
+
+with timing.stage("load_local"):
+    local_schedules = load_local_schedules(csv_fingerprint())
+local_hashes = local_schedules.hashes
+local_csvs = local_schedules.names
 
 # -------------------------------
 # 🖱️ Sidebar Controls
@@ -40,24 +46,128 @@ with st.sidebar:
     st.header("📂 Choose a Section")
     selected_sheet = st.selectbox("Section", [""] + sorted(local_csvs))
 
+    st.header("🗂️ My Sections")
+    my_sections = st.multiselect(
+        "Sections you teach",
+        sorted(local_csvs),
+        key="my_sections",
+        placeholder="Pick sections for a this-week overview",
+        help="Shows when no single section is chosen above.",
+    )
+run.context["section"] = selected_sheet or None
+
 if selected_sheet:
     st.title(f"📚 Instructor Resource Hub — :blue[**{selected_sheet}**]")
+elif my_sections:
+    st.title("📚 Instructor Resource Hub — :blue[**My Sections**]")
 else:
     st.title("📚 Instructor Resource Hub")
 
 # -------------------------------
-# 📥 Cached Google Loader
+# 📥 Shared Google Loader
 # -------------------------------
-@st.cache_data(ttl=3600)
+@st.cache_resource
+def get_sheets_connection():
+    # one authorized session per process, shared by every user and rerun
+    return SheetsConnection(st.secrets["google_credentials"])
+
+@st.cache_resource
+def get_sheets_fetcher():
+    # single-flight + read quota + 429 backoff in front of the shared connection
+    return SheetsFetcher(get_sheets_connection())
+
+@st.cache_resource
+def get_sheets_cache():
+    # stale-while-revalidate: shared by every session, refreshed off the render thread
+    return SheetsCache(max_age=3600)
+
+def refresh_sheet_data():
+    # resolve the fetcher here; auth + one values:batchGet run on the background thread
+    fetcher = get_sheets_fetcher()
+    return get_sheets_cache().refresh_async(fetcher.fetch_all_sections)
+
 def fetch_sheet_data(sheet_name):
-    ws = spreadsheet.worksheet(sheet_name)
-    values = ws.get_all_values("A1:I25")
-    if not values:
-        return pd.DataFrame()
-    df = pd.DataFrame(values[1:], columns=values[0])
-    df["section"] = sheet_name
-    df["date"] = df["date"].apply(lambda x: clean_and_parse_date(x))
-    return df
+    """Cached Google frame for a section (or None) — never waits on the API."""
+    df, _ = get_sheets_cache().get(sheet_name)
+    hit = df is not None and not df.empty
+    timing.count("fetch_sheet_data.hit" if hit else "fetch_sheet_data.miss")
+    return df if hit else None
+
+@st.fragment(run_every=1)
+def wait_for_sheet_refresh():
+    # polls the background fetch; a full rerun then swaps the fresh frame in
+    if not get_sheets_cache().pending:
+        st.rerun()
+    st.caption("⏳ Checking Google Sheets for a newer version — showing the local copy for now.")
+
+# -------------------------------
+# 🗃️ Rendered announcements (artifact on disk, else computed once)
+# -------------------------------
+@st.cache_resource(max_entries=64)
+def get_local_render(section_name, key, _df):
+    # pre-rendered artifact if one matches the CSV hash; otherwise render and write it through
+    timing.count("render.miss")
+    rendered = load_artifact(section_name, key)
+    if rendered is None:
+        rendered = render_section(section_name, _df)
+        save_artifact(section_name, key, rendered)
+    return rendered
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def get_live_render(section_name, data_hash, _df):
+    # Google data: `_df` is skipped by Streamlit's hasher; (section_name, data_hash) is the key
+    timing.count("render.miss")
+    return render_section(section_name, _df)
+
+def get_rendered(section_name, df, from_google):
+    timing.count("render.calls")
+    if from_google:
+        return get_live_render(section_name, schedule_hash(df), df)
+    return get_local_render(section_name, artifact_key(local_hashes[section_name]), df)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def get_week_overview(sections, friday, fingerprint):
+    # chosen sections -> one consolidated frame -> one grouped sweep; `fingerprint` ties it to the CSVs
+    return plan_week_across_sections(local_schedules.frame(sections), friday)
+
+# -------------------------------
+# 🧩 Panels (only the active one runs; each is a fragment)
+# -------------------------------
+PANELS = {
+    "schedule": ':green-background[:green[**📅 LiveLab Schedule**]]',
+    "announcements": ':blue-background[:blue[**📣 HQ Announcement Templates**]]',
+    "reminders": ':violet-background[:violet[**📝 End of LiveLab Reminders**]]',
+}
+
+@st.fragment
+def schedule_panel(df):
+    st.markdown("##### :green-background[:green[**📅 LiveLab Schedule**]]")
+    st.caption("This is your section's full LiveLab schedule — use to double check dates, topics, and plan ahead!")
+
+    # Display DataFrame (cleaned)
+    display_df = df[["LL_num", "date_display", "livelab_title"]].rename(columns={
+        "LL_num": "LiveLab #",
+        "date_display": "Date",
+        "livelab_title": "LiveLab Title"
+    })
+    with timing.stage("display"):
+        st.dataframe(display_df, use_container_width=True, hide_index=True, height = 875)
+
+@st.fragment
+def announcements_panel(section_name, df, from_google):
+    st.markdown("##### :blue-background[:blue[📣 HQ Announcement Templates]]")
+    st.caption("Quick-access templates you can copy for your Friday announcements, with each one customized based on your LiveLab schedule! Please just use these as *templates*, and feel free to make them your own!")
+
+    with timing.stage("announcements_tab"):
+        paint_announcements(get_rendered(section_name, df, from_google))
+
+@st.fragment
+def reminders_panel(section_name, df, from_google):
+    st.markdown("##### :violet-background[:violet[**📝 End of LiveLab Reminders**]]")
+    st.caption("Use these to close out each LiveLab with clear next steps.")
+
+    with timing.stage("reminders_tab"):
+        paint_reminders(get_rendered(section_name, df, from_google))
 
 # -------------------------------
 # 🔁 Track selection and reset Google toggle
@@ -70,120 +180,91 @@ if selected_sheet != st.session_state.prev_selected_sheet:
     st.session_state.prev_selected_sheet = selected_sheet
 
 # -------------------------------
-# 📊 Tabs: LiveLab Schedule + HQ Announcements
+# 📊 Panels: LiveLab Schedule + HQ Announcements + Reminders
 # -------------------------------
 if selected_sheet:
-    st.caption("Use the tabs below — 📅 LiveLab Schedule, 📣 HQ Announcement Templates, and 📝 End-of-LiveLab Reminders—to view different resources available to you.")
-    # ✅ Google Sheets toggle at bottom of all tabs
+    st.caption("Pick a view below — 📅 LiveLab Schedule, 📣 HQ Announcement Templates, or 📝 End of LiveLab Reminders—to see the different resources available to you.")
+    # ✅ Google Sheets toggle above the panels
     st.toggle(
         "Is something missing? Toggle to connect to [this Google Sheet](https://docs.google.com/spreadsheets/d/1uRZxn6l4h41ek2dkR7Dfe-a-vzePoSRYPwaTEi2K6iw/edit?usp=sharing) for the most up-to-date version. _(⚠️ Heads up: Connecting via the API may take a few moments.)_",
         value=st.session_state.get("use_google", False),
         key="use_google")
 
-    tab1, tab2, tab3 = st.tabs([':green-background[:green[**📅 LiveLab Schedule**]]', ':blue-background[:blue[**📣 HQ Announcement Templates**]]', ':violet-background[:violet[**📝 End of LiveLab Reminders**]]']) 
-
-    with tab1:
-        st.markdown("##### :green-background[:green[**📅 LiveLab Schedule**]]")
-
-        st.caption("This is your section's full LiveLab schedule — use to double check dates, topics, and plan ahead!")
-
-        
-        # Load data
-        if st.session_state.get("use_google", False):
-            # 🔐 Google Sheets Setup
-            scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-
-            # Convert Streamlit secrets to dictionary
-            creds_dict = dict(st.secrets["google_credentials"])
-
-            # Create credentials with scope
-            creds = Credentials.from_service_account_info(creds_dict, scopes=scope)
+    # Load data: the local copy paints instantly; Google data swaps in once fetched
+    google_df = None
+    if st.session_state.get("use_google", False):
+        with timing.stage("load_google"):
+            sheets_cache = get_sheets_cache()
+            google_df = fetch_sheet_data(selected_sheet)
+            # refetch on age only: a fresh fetch without this section won't gain it by asking again
+            if not sheets_cache.is_fresh:
+                refresh_sheet_data()
+
+        if sheets_cache.pending:
+            wait_for_sheet_refresh()
+        elif sheets_cache.last_error is not None:
+            st.warning(f"⚠️ Couldn't reach Google Sheets ({sheets_cache.last_error}). Showing the local copy.")
+        elif google_df is None and sheets_cache.is_fresh:
+            st.warning(f"⚠️ {selected_sheet} wasn't found in Google Sheets (or is empty). Showing the local copy.")
+    run.context["source"] = "google" if google_df is not None else "local"
+
+    if google_df is not None:
+        df = google_df
+        minutes_ago = int((time.time() - get_sheets_cache().fetched_at) // 60)
+        st.caption(f":green-background[:green[**✅ Updated**]] from Google Sheets {f'{minutes_ago} min ago' if minutes_ago else 'just now'}.")
+    elif selected_sheet in local_schedules:
+        df = local_schedules[selected_sheet]
+    else:
+        st.error(f"⚠️ Local CSV not found: ./csv_data/{selected_sheet}.csv")
+        st.stop()
+
+    # Row count check
+    num_labs = df["livelab_title"].notna().sum()
+    if num_labs < 12:
+        st.warning(f"⚠️ Only {num_labs} LiveLabs loaded from {selected_sheet}. "
+                    "This might be incomplete — try toggling Google Sheets for the most up-to-date version.")
+
+    # Only the active panel runs; switching panels is a normal rerun
+    active_panel = st.radio(
+        "Panel",
+        list(PANELS),
+        format_func=PANELS.get,
+        horizontal=True,
+        key="active_panel",
+        label_visibility="collapsed",
+    )
+    run.context["panel"] = active_panel
+
+    if active_panel == "schedule":
+        schedule_panel(df)
+    elif active_panel == "announcements":
+        announcements_panel(selected_sheet, df, google_df is not None)
+    else:
+        reminders_panel(selected_sheet, df, google_df is not None)
+
+
+
+elif my_sections:
+    # -------------------------------
+    # 🗂️ This Week Across My Sections
+    # -------------------------------
+    st.caption("Your week at a glance — the last and next LiveLab, what to watch, and what's due for every section you teach.")
+    today = pd.Timestamp.today().normalize()
+    picked = st.date_input("Week of", value=today + pd.Timedelta(days=4 - today.weekday()), format="MM/DD/YYYY")
+    friday = adjust_to_most_recent_friday(pd.Timestamp(picked))
 
-            # Authorize gspread client
-            client = gspread.authorize(creds)
+    with timing.stage("week_overview"):
+        posts = get_week_overview(tuple(my_sections), friday, csv_fingerprint())
 
-            # Open spreadsheet
-            spreadsheet = client.open("Curriculum Schedules All Tracks")
+    st.markdown(f"##### :blue-background[:blue[**📆 Week of Friday, {friday.strftime('%B')} {friday.day}**]]")
+    st.dataframe(week_summary_frame(posts), use_container_width=True, hide_index=True)
 
-            with st.spinner(f"Loading data for {selected_sheet} from Google Sheets..."):
-                df = fetch_sheet_data(selected_sheet)
-                df["section"] = selected_sheet
-                df["date_display"] = df["date"].apply(lambda x: add_ordinal_suffix(x))
-        else:
-            csv_path = f"./csv_data/{selected_sheet}.csv"
-            if os.path.exists(csv_path):
-                with st.spinner(f"Loading data for {selected_sheet} from local file..."):
-                    df = pd.read_csv(csv_path)
-                    df["section"] = selected_sheet
-                    df["date"] = df["date"].apply(lambda x: clean_and_parse_date(x))
-                    df["date_display"] = df["date"].apply(lambda x: add_ordinal_suffix(x))
-
-            else:
-                st.error(f"⚠️ Local CSV not found: {csv_path}")
-                st.stop()
-
-        # Row count check
-        num_labs = df["livelab_title"].notna().sum()
-        if num_labs < 12:
-            st.warning(f"⚠️ Only {num_labs} LiveLabs loaded from {selected_sheet}. "
-                        "This might be incomplete — try toggling Google Sheets for the most up-to-date version.")
-
-        # Display DataFrame (cleaned)
-        display_df = df[["LL_num", "date_display", "livelab_title"]].rename(columns={
-            "LL_num": "LiveLab #",
-            "date_display": "Date",
-            "livelab_title": "LiveLab Title"
-        })
-        st.dataframe(display_df, use_container_width=True, hide_index=True, height = 875)
-    
-    with tab2:
-        st.markdown("##### :blue-background[:blue[📣 HQ Announcement Templates]]")
-        st.caption("Quick-access templates you can copy for your Friday announcements, with each one customized based on your LiveLab schedule! Please just use these as *templates*, and feel free to make them your own!")
-
-        # --- Two schedules: detect LL reset ---
-        part1_df, part2_df = split_by_part_ll_reset(df)
-        part2_start = part2_df["date"].min() if not part2_df.empty else None
-
-        # Always show Part 1 up top
-        with st.expander(":blue[**📆 SkillBuilder Watch By Schedule**]", expanded=False):
-            st.markdown(build_watch_markdown_part1(part1_df))
-
-        # --- Friday posts + insert Part 2 at the correct time ---
-        if df["date"].notna().any():
-            start_date = df["date"].min()
-            end_date = df["date"].max() + pd.Timedelta(days=7)
-            section = df["wave_section"].iloc[0] if "wave_section" in df.columns else None
-            track = df["track"].iloc[0] if "track" in df.columns else None
-
-            fridays = get_fridays_between(start_date, end_date)
-            part2_inserted = False
-
-            for friday in fridays:
-                # Insert Part 2 when we hit its first week
-                if (not part2_inserted) and (part2_start is not None) and (friday >= part2_start):
-                    with st.expander(":blue[**📆 SkillBuilder Watch By Schedule**]", expanded=False):
-                        st.markdown(build_watch_markdown_part2(part2_df))
-                    part2_inserted = True
-
-                generate_friday_messages(df, track, friday, section=section)
-
-            # Edge case: if no Friday matched (e.g., part2 starts after last Friday), append at end
-            if (not part2_inserted) and (part2_start is not None):
-                with st.expander(":blue[**📆 SkillBuilder Watch By Schedule**]", expanded=False):
-                    st.markdown(build_watch_markdown_part2(part2_df))
+    for name, post in posts.items():
+        error = friday_post_error(post)
+        if error:
+            st.error(f"**{name}** — {error}")
         else:
-            st.warning("⚠️ No dates found in the schedule.")
-
-    with tab3:
-        st.markdown("##### :violet-background[:violet[**📝 End of LiveLab Reminders**]]")
-        st.caption("Use these to close out each LiveLab with clear next steps.")
-
-        # If you want to scope to the current section/track explicitly:
-        curr_section = df["wave_section"].iloc[0] if "wave_section" in df.columns else None
-        curr_track   = df["track"].iloc[0] if "track" in df.columns else None
-        render_end_of_livelab_reminders(df, track=curr_track, section=curr_section)
-
-
+            render_post_blocks(f"📢 **:blue[{name}]** — Friday post", friday_post_blocks(post))
 
 else:
     # -------------------------------
@@ -196,3 +277,23 @@ else:
 
     st.caption("Have a question, notice something off, or want to request a feature? [Message Katie Sylvia on Slack!](https://podiumglobal.slack.com/team/U03TJUYNSF8)")
 
+
+# -------------------------------
+# 🐞 Debug Timings (opt-in)
+# -------------------------------
+with st.sidebar:
+    show_timings = st.checkbox("🐞 Show timings", key="debug_timings")
+timing.finish_run()
+if show_timings:
+    with st.sidebar:
+        st.caption(f"This rerun: **{run.total_ms:.1f} ms** total")
+        st.dataframe(
+            pd.DataFrame(
+                [{"Stage": "↳ " * depth + name, "ms": round(ms, 1)} for name, depth, ms in run.stages],
+                columns=["Stage", "ms"],
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.caption(f"Process counters · shared schedule store {local_schedules.memory_usage() / 1024:.0f} KB")
+        st.json(timing.counters(), expanded=False)
@@ -0,0 +1,217 @@
+"""
+Benchmarks for the schedule-processing hot paths in functions.py.
+
+Times each case on synthetic schedules from one real-sized section (25 rows)
+up to a 10k-row multi-section frame. Streamlit is stubbed out so the Friday
+and reminder cases measure our logic, not widget rendering.
+
+    python -m benchmarks.bench_schedule                                # print timings
+    python -m benchmarks.bench_schedule --save benchmarks/baseline.json
+    python -m benchmarks.bench_schedule --compare benchmarks/baseline.json --threshold 0.25
+
+--compare exits with status 1 if any case got slower than the baseline by
+more than the threshold (median per-call time).
+"""
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import time
+import types
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import functions
+from benchmarks.synthetic import synthetic_schedule
+
+SIZES = [25, 250, 2500, 10000]
+
+
+# -------------------------------
+# 🪄 Streamlit stub (no-op widgets)
+# -------------------------------
+class _StreamlitStub(types.ModuleType):
+    """Stands in for `streamlit`: every call is a no-op, containers are null contexts."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._noop
+
+    @staticmethod
+    def _noop(*args, **kwargs):
+        return contextlib.nullcontext()
+
+
+def install_streamlit_stub():
+    # functions.py imports streamlit lazily, so the stub is picked up on the next call
+    sys.modules["streamlit"] = _StreamlitStub("streamlit")
+
+
+# -------------------------------
+# 🧪 Cases
+# -------------------------------
+def _section_info(df):
+    return df["track"].iloc[0], df["wave_section"].iloc[0]
+
+
+def _fridays(df):
+    return functions.get_fridays_between(df["date"].min(), df["date"].max() + pd.Timedelta(days=7))
+
+
+def case_parse_dates_scalar(raw, df):
+    return [functions.clean_and_parse_date(v) for v in raw["date"]]
+
+
+def case_parse_dates_vectorized(raw, df):
+    return functions.parse_schedule_dates(raw["date"])
+
+
+def case_split_by_part_ll_reset(raw, df):
+    return functions.split_by_part_ll_reset(df)
+
+
+def case_watch_markdown_core(raw, df):
+    return functions._build_watch_markdown_core(df, "### Hey everyone! 👋", "Here's your SkillBuilder schedule:")
+
+
+def case_watch_guides_batch(raw, df):
+    return functions.build_watch_guides(df)
+
+
+def case_milestone_due_dates(raw, df):
+    return functions.milestone_due_dates(df.drop(columns=functions.MILESTONE_DUE_COLUMN))
+
+
+def case_friday_messages(raw, df):
+    track, section = _section_info(df)
+    for friday in _fridays(df):
+        functions.generate_friday_messages(df, track, friday, section=section)
+
+
+def case_end_of_livelab_reminders(raw, df):
+    track, section = _section_info(df)
+    functions.render_end_of_livelab_reminders(df, track=track, section=section)
+
+
+CASES = {
+    "parse_dates_scalar": case_parse_dates_scalar,
+    "parse_dates_vectorized": case_parse_dates_vectorized,
+    "split_by_part_ll_reset": case_split_by_part_ll_reset,
+    "watch_markdown_core": case_watch_markdown_core,
+    "watch_guides_batch": case_watch_guides_batch,
+    "milestone_due_dates": case_milestone_due_dates,
+    "friday_messages": case_friday_messages,
+    "end_of_livelab_reminders": case_end_of_livelab_reminders,
+}
+
+
+# -------------------------------
+# ⏱️ Timing
+# -------------------------------
+def time_case(fn, args, min_time=0.2, repeat=5):
+    """Per-call seconds: loops are scaled (like timeit) so each repeat runs >= min_time."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn(*args)
+        samples.append((time.perf_counter() - start) / loops)
+    return {"median_s": statistics.median(samples), "min_s": min(samples), "loops": loops, "repeat": repeat}
+
+
+def run(sizes=SIZES, cases=None, min_time=0.2, repeat=5):
+    install_streamlit_stub()
+    results = {}
+    for size in sizes:
+        raw = synthetic_schedule(size, parsed=False)
+        df = synthetic_schedule(size)
+        for name, fn in CASES.items():
+            if cases and name not in cases:
+                continue
+            key = f"{name}[{size}]"
+            results[key] = time_case(fn, (raw, df), min_time=min_time, repeat=repeat)
+            print(f"{key:<40} {_fmt(results[key]['median_s'])}", flush=True)
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+# -------------------------------
+# 📊 Compare against a baseline
+# -------------------------------
+def _fmt(seconds):
+    if seconds >= 1:
+        return f"{seconds:8.3f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.1f} µs"
+
+
+def compare(baseline, current, threshold=0.25):
+    """Print old vs new medians; return the keys that regressed by more than `threshold`."""
+    regressions = []
+    print(f"\n{'case':<40} {'baseline':>11} {'current':>11} {'change':>8}")
+    for key, new in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            print(f"{key:<40} {'—':>11} {_fmt(new['median_s'])} {'new':>8}")
+            continue
+        ratio = new["median_s"] / old["median_s"] if old["median_s"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = "  ⚠️ REGRESSION"
+        elif ratio < 1 / (1 + threshold):
+            flag = "  ✅ faster"
+        print(f"{key:<40} {_fmt(old['median_s'])} {_fmt(new['median_s'])} {ratio:7.2f}x{flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the schedule-processing functions.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=SIZES, help=f"rows per frame (default: {SIZES})")
+    parser.add_argument("--cases", nargs="*", choices=sorted(CASES), help="only these cases (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing repeat (default: 0.2)")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case (default: 5)")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before flagging (default: 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.cases, min_time=args.min_time, repeat=args.repeat)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(current, fh, indent=2)
+        print(f"💾 Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(baseline, current, threshold=args.threshold)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}.")
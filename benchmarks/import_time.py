@@ -0,0 +1,96 @@
+"""
+Cold-start import budget for app.py.
+
+Runs app.py's top-level imports in a fresh interpreter under `-X importtime`.
+It reports the slowest packages and fails when:
+  - any Google client module (gspread, google.oauth2, oauth2client, ...) is
+    imported on the default local-CSV path, or
+  - the total import time exceeds the budget.
+
+    python -m benchmarks.import_time                   # default budget
+    python -m benchmarks.import_time --budget-ms 2500 --top 15
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+DEFERRED = ("gspread", "gspread_dataframe", "oauth2client", "google.oauth2", "google.auth", "googleapiclient")
+DEFAULT_BUDGET_MS = 1000
+
+
+def app_import_statements(path=APP_PATH):
+    """app.py's module-level import statements, as source lines."""
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read(), path)
+    return [ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def measure(statements):
+    """{module: (self_us, cumulative_us)} from one fresh `python -X importtime` run."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(statements)],
+        capture_output=True, text=True, check=True, cwd=ROOT,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def summarize(modules):
+    total_us = sum(self_us for self_us, _ in modules.values())
+    by_package = {}
+    for name, (self_us, _) in modules.items():
+        top = name.split(".")[0]
+        by_package[top] = by_package.get(top, 0) + self_us
+    return total_us, by_package
+
+
+def measure_median(runs=3):
+    """The median of `runs` fresh measurements: (total ms, {package: self ms}, {module: timings})."""
+    statements = app_import_statements()
+    measured = [measure(statements) for _ in range(runs)]
+    totals = [summarize(modules)[0] for modules in measured]
+    median_run = measured[totals.index(sorted(totals)[len(totals) // 2])]
+    total_us, by_package = summarize(median_run)
+    return total_us / 1000, {package: self_us / 1000 for package, self_us in by_package.items()}, median_run
+
+
+def budget_failures(total_ms, modules, budget_ms=DEFAULT_BUDGET_MS):
+    """What is wrong with one measurement; empty when it is within budget."""
+    failures = []
+    leaked = sorted(name for name in modules if name.startswith(DEFERRED))
+    if leaked:
+        failures.append(f"Google client modules imported at startup: {', '.join(leaked[:5])}{' ...' if len(leaked) > 5 else ''}")
+    if total_ms > budget_ms:
+        failures.append(f"{total_ms:.0f} ms is over the {budget_ms:.0f} ms budget")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check app.py's cold-start import time against a budget.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help=f"max total import ms (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters to measure; the median is used (default: 3)")
+    parser.add_argument("--top", type=int, default=10, help="slowest packages to list (default: 10)")
+    args = parser.parse_args()
+
+    total_ms, by_package, modules = measure_median(args.runs)
+
+    print(f"app.py imports: {len(modules)} modules, {total_ms:.0f} ms (median of {args.runs})")
+    for package, self_ms in sorted(by_package.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {package:<24} {self_ms:8.1f} ms")
+
+    failures = budget_failures(total_ms, modules, args.budget_ms)
+    if failures:
+        for failure in failures:
+            print(f"⚠️ {failure}")
+        sys.exit(1)
+    print(f"✅ Within the {args.budget_ms:.0f} ms budget; the Google stack stays deferred.")
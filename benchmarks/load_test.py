@@ -0,0 +1,296 @@
+"""
+Load test: N concurrent instructor sessions against one app process.
+
+Each simulated session is a Streamlit AppTest running app.py on its own
+thread, so every session shares the process-wide caches (schedule store,
+rendered announcements, Sheets connection) exactly like real browser
+sessions do. A session picks a random section, then randomly switches
+sections, switches panels and flips the Google Sheets toggle. Google
+Sheets is served by utils/fake_sheets.py with configurable latency and
+error rate.
+
+Reports rerun latency percentiles (the app's own per-rerun total, plus
+wall time per AppTest run), peak RSS and cache hit rates, and can fail
+when p95 goes over a budget:
+
+    python -m benchmarks.load_test                                   # 20 sessions x 10 actions
+    python -m benchmarks.load_test --sessions 50 --latency 0.5 --error-rate 0.1
+    python -m benchmarks.load_test --max-p95-ms 250 --json load.json
+"""
+import argparse
+import contextlib
+import functools
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+
+import utils.sheets
+from utils import timing
+from utils.fake_sheets import FakeClient
+from utils.snapshot import CSV_DIR
+
+APP_PATH = "app.py"
+# shared_apptest_runtime() patches AppTest internals checked against this
+# release (the one requirements.txt pins); re-check it before moving the pin
+STREAMLIT_VERSION = "1.39"
+ACTIONS = ("section", "panel", "toggle")
+PANELS = ("schedule", "announcements", "reminders")
+
+
+# -------------------------------
+# 🧪 Fake backend + rerun capture
+# -------------------------------
+def install_fake_sheets(latency=0.3, error_rate=0.0, seed=0, csv_dir=CSV_DIR):
+    """Point app.py's SheetsConnection at a FakeClient (app.py re-imports it on every rerun)."""
+    client = FakeClient.from_csv_dir(csv_dir, latency=(latency / 2, latency * 1.5) if latency else 0.0,
+                                     error_rate=error_rate, seed=seed)
+    utils.sheets.SheetsConnection = functools.partial(utils.sheets.SheetsConnection, client=client)
+    return client
+
+
+@contextlib.contextmanager
+def shared_apptest_runtime(secrets):
+    """
+    Let many AppTests run at once in one process, like sessions on one server.
+
+    AppTest.run() installs a fresh mock Runtime, st.secrets and the appTest
+    config flag for every run and resets them afterwards, so two concurrent
+    runs would pull the runtime out from under each other. Here they are set
+    once for the whole load test (one runtime = one set of caches, as in
+    production) and AppTest's per-run swaps land on a throwaway class.
+
+    Those are private details, so this refuses to run on any Streamlit
+    other than STREAMLIT_VERSION instead of quietly measuring the wrong thing.
+    """
+    import streamlit as st
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.secrets import Secrets
+    from streamlit.testing.v1 import app_test
+
+    if st.__version__.rsplit(".", 1)[0] != STREAMLIT_VERSION:
+        raise RuntimeError(
+            f"load_test patches AppTest internals of Streamlit {STREAMLIT_VERSION}.x, found {st.__version__}; "
+            "check shared_apptest_runtime() against the new release and update STREAMLIT_VERSION"
+        )
+    missing = [
+        name for owner, name in ((Runtime, "_instance"), (app_test, "Runtime"), (Secrets(), "_secrets"))
+        if not hasattr(owner, name)
+    ]
+    if missing:
+        raise RuntimeError(f"Streamlit internals moved ({', '.join(missing)}); update shared_apptest_runtime()")
+
+    runtime = mock.MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    shared_secrets = Secrets()
+    shared_secrets._secrets = secrets
+
+    saved = (Runtime._instance, st.secrets, app_test.Runtime, config.get_option("global.appTest"))
+    Runtime._instance = runtime
+    st.secrets = shared_secrets
+    app_test.Runtime = type("PerRunRuntime", (), {"_instance": None})
+    config.set_option("global.appTest", True)
+    try:
+        yield
+    finally:
+        Runtime._instance, st.secrets, app_test.Runtime, app_test_flag = saved
+        config.set_option("global.appTest", app_test_flag)
+
+
+class _RerunCollector(logging.Handler):
+    """Collects the JSON line app.py logs at the end of every rerun (and keeps them off stderr)."""
+
+    def __init__(self):
+        super().__init__()
+        self.reruns = []
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        event = json.loads(record.getMessage())
+        with self._lock:
+            self.reruns.append(event)
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024  # bytes on macOS, KiB on Linux
+
+
+# -------------------------------
+# 👩‍🏫 One simulated instructor
+# -------------------------------
+def simulate_session(session_id, actions, timeout, seed, think=0.5):
+    """One instructor: open the app, pick a section, then `actions` random interactions."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(f"{seed}|{session_id}")
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    walls, errors, replays = [], 0, 0
+
+    def step(do):
+        nonlocal errors, replays
+        if think:
+            time.sleep(rng.uniform(0, 2 * think))  # reading the page; not part of the latency
+        rerun = at.main.root.run if walls else at.run  # replays the widget values being sent
+        start = time.perf_counter()
+        do()
+        # st.rerun() (the Sheets refresh poller) ends an AppTest run with an empty
+        # page instead of following it; a browser reruns with its widget values
+        while not at.sidebar.selectbox and replays < 100:
+            replays += 1
+            rerun()
+        walls.append((time.perf_counter() - start) * 1000)
+        errors += len(at.exception)
+
+    step(at.run)
+    sections = [name for name in at.sidebar.selectbox[0].options if name]
+    step(lambda: at.sidebar.selectbox[0].select(rng.choice(sections)).run())
+    for _ in range(actions):
+        action = rng.choice(ACTIONS)
+        if action == "section":
+            step(lambda: at.sidebar.selectbox[0].select(rng.choice(sections)).run())
+        elif action == "panel":
+            step(lambda: at.radio(key="active_panel").set_value(rng.choice(PANELS)).run())
+        else:
+            toggle = at.toggle(key="use_google")
+            step(lambda: toggle.set_value(not toggle.value).run())
+    return walls, errors, replays
+
+
+# -------------------------------
+# 📊 Run + report
+# -------------------------------
+def _percentiles(values):
+    if not values:
+        return {}
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": round(p50, 1), "p95": round(p95, 1), "p99": round(p99, 1), "max": round(max(values), 1), "n": len(values)}
+
+
+def _rate(hits, total):
+    return round(hits / total, 3) if total else None
+
+
+def cache_hit_rates(before, after):
+    """Hit rates from the process counters (deltas over the run)."""
+    delta = {key: after.get(key, 0) - before.get(key, 0) for key in after}
+    sheet_hits, sheet_misses = delta.get("fetch_sheet_data.hit", 0), delta.get("fetch_sheet_data.miss", 0)
+    renders, render_misses = delta.get("render.calls", 0), delta.get("render.miss", 0)
+    api_calls, api_saved = delta.get("sheets.calls", 0), delta.get("sheets.saved", 0)
+    return {
+        "google_frames": _rate(sheet_hits, sheet_hits + sheet_misses),
+        "rendered_announcements": _rate(renders - render_misses, renders),
+        "sheets_single_flight": _rate(api_saved, api_calls + api_saved),
+        "counters": delta,
+    }
+
+
+def run(sessions=20, actions=10, latency=0.3, error_rate=0.0, think=0.5, timeout=60, seed=0):
+    client = install_fake_sheets(latency=latency, error_rate=error_rate, seed=seed)
+
+    logger = logging.getLogger("instructor_hub.timing")
+    collector = _RerunCollector()
+    saved_handlers = logger.handlers[:]
+    logger.handlers = [collector]
+    # AppTest touches widgets from the session threads, outside a script run
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(
+        lambda record: "missing ScriptRunContext" not in record.getMessage()
+    )
+    before = timing.counters()
+    rss_before = _peak_rss_mb()
+
+    start = time.perf_counter()
+    try:
+        with shared_apptest_runtime({"google_credentials": {"type": "fake"}}), ThreadPoolExecutor(max_workers=sessions) as pool:
+            futures = [pool.submit(simulate_session, i, actions, timeout, seed, think) for i in range(sessions)]
+            results = [f.result() for f in futures]
+    finally:
+        logger.handlers = saved_handlers
+    elapsed = time.perf_counter() - start
+
+    walls = [ms for session_walls, _, _ in results for ms in session_walls]
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "sessions": sessions,
+            "actions": actions,
+            "latency_s": latency,
+            "error_rate": error_rate,
+            "think_s": think,
+            "cpus": os.cpu_count(),
+        },
+        "elapsed_s": round(elapsed, 2),
+        "reruns_per_s": round(len(walls) / elapsed, 1),
+        "app_exceptions": sum(errors for _, errors, _ in results),
+        "rerun_replays": sum(replays for _, _, replays in results),
+        "rerun_ms": _percentiles([event["total_ms"] for event in collector.reruns if event.get("total_ms") is not None]),
+        "apptest_wall_ms": _percentiles(walls),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "rss_before_mb": round(rss_before, 1),
+        "cache_hit_rate": cache_hit_rates(before, timing.counters()),
+        "fake_sheets_calls": dict(client.open(utils.sheets.SPREADSHEET_NAME).calls),
+    }
+
+
+def print_report(report):
+    meta = report["meta"]
+    print(f"{meta['sessions']} sessions x {meta['actions']} actions "
+          f"(fake Sheets latency {meta['latency_s']}s, error rate {meta['error_rate']:.0%}, think {meta['think_s']}s) "
+          f"in {report['elapsed_s']} s — {report['reruns_per_s']} reruns/s")
+    for label, key in (("app rerun", "rerun_ms"), ("AppTest wall", "apptest_wall_ms")):
+        p = report[key]
+        if p:
+            print(f"  {label:<14} p50 {p['p50']:8.1f} ms   p95 {p['p95']:8.1f} ms   p99 {p['p99']:8.1f} ms   (n={p['n']})")
+    print(f"  peak RSS       {report['peak_rss_mb']:.1f} MB (before sessions: {report['rss_before_mb']:.1f} MB)")
+    for name, value in report["cache_hit_rate"].items():
+        if name != "counters":
+            print(f"  hit rate       {name:<24} {'—' if value is None else f'{value:.1%}'}")
+    print(f"  fake Sheets    {report['fake_sheets_calls']}")
+    if report["app_exceptions"]:
+        print(f"  ⚠️ {report['app_exceptions']} app exception(s) during the run")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate concurrent instructor sessions against app.py.")
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent sessions (default: 20)")
+    parser.add_argument("--actions", type=int, default=10, help="interactions per session after the first load (default: 10)")
+    parser.add_argument("--latency", type=float, default=0.3, help="mean fake Sheets API latency in seconds (default: 0.3)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="chance a fake Sheets call fails with 429 (default: 0)")
+    parser.add_argument("--think", type=float, default=0.5, help="mean pause between a session's actions in seconds (default: 0.5)")
+    parser.add_argument("--timeout", type=float, default=60, help="per-rerun AppTest timeout in seconds (default: 60)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-p95-ms", type=float, help="fail if the app's p95 rerun time exceeds this")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.sessions, args.actions, args.latency, args.error_rate, args.think, args.timeout, args.seed)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"💾 Saved report to {args.json}")
+
+    failures = []
+    if report["app_exceptions"]:
+        failures.append(f"{report['app_exceptions']} app exception(s)")
+    if args.max_p95_ms is not None and report["rerun_ms"].get("p95", 0) > args.max_p95_ms:
+        failures.append(f"p95 {report['rerun_ms']['p95']:.1f} ms is over the {args.max_p95_ms:.0f} ms budget")
+    if failures:
+        print(f"⚠️ {'; '.join(failures)}")
+        sys.exit(1)
+    print("✅ Load test passed.")
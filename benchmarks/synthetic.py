@@ -0,0 +1,83 @@
+# =========================================================
+# 🧪 Synthetic Schedules
+# =========================================================
+# Deterministic schedule frames shaped like csv_data/*.csv: Monday /
+# Wednesday LiveLabs, LL numbers that reset for Part 2, holiday rows,
+# SkillBuilder videos and milestones. One section is ~25 rows like the
+# real sheets; bigger frames stack many sections (10k rows = 400 of them).
+# =========================================================
+import csv
+import io
+import random
+from datetime import date, timedelta
+
+import pandas as pd
+
+from functions import MILESTONE_DUE_COLUMN, add_ordinal_suffix, milestone_due_dates, parse_schedule_dates
+
+TRACKS = ["DA", "DC", "DM", "RT", "WD"]
+COLUMNS = [
+    "wave_section", "track", "LL_num", "date", "livelab_title",
+    "livelab_lesson_plan", "videos_watch_by", "assignment_due_after", "notes",
+]
+ROWS_PER_SECTION = 25
+TERM_START = date(2025, 8, 25)  # a Monday
+
+
+def _date_str(d, holiday=False):
+    text = f"{d.strftime('%A')}, {d.strftime('%m/%d')}"
+    return f"{text} SKIPPED FOR HOLIDAY!" if holiday else text
+
+
+def synthetic_section_rows(wave_section, track, rows=ROWS_PER_SECTION, start=TERM_START, seed=0):
+    """Raw CSV-style rows (all strings) for one section."""
+    rng = random.Random(f"{seed}|{track}|{wave_section}")
+    part_len = max(1, (rows - 1) // 2)
+    out = [[wave_section, track, "", _date_str(start - timedelta(days=2)), "", "", "", "", ""]]  # blank kickoff row
+    sb = ms = 0
+    for i in range(rows - 1):
+        day = start + timedelta(weeks=i // 2, days=2 * (i % 2))  # Mon / Wed
+        ll = i % part_len + 1
+        holiday = rng.random() < 0.08
+        if holiday:
+            out.append([wave_section, track, f"LL#{ll}", _date_str(day, True), "HOLIDAY", "", "", "", "No LiveLab will be held on this day!"])
+            continue
+        videos = ""
+        if rng.random() < 0.5:
+            sb += 1
+            videos = f"SkillBuilder {sb}: Topic {sb}"
+        milestone = ""
+        if rng.random() < 0.3:
+            ms += 1
+            milestone = f"Milestone {ms}: Project {ms}"
+        notes = "In this lab, we'll work through a case study together." if rng.random() < 0.3 else ""
+        out.append([wave_section, track, f"LL#{ll}", _date_str(day), f"LiveLab {i + 1}", "", videos, milestone, notes])
+    return out[:rows]
+
+
+def synthetic_schedule(rows, seed=0, parsed=True):
+    """
+    A frame of `rows` rows: one section when rows <= 25, otherwise as many
+    stacked sections as it takes. With parsed=True it matches what the app
+    reads from utils/store.py (parsed `date`, `date_display`, `section` and
+    the precomputed milestone due dates).
+    """
+    records = []
+    n_sections = max(1, -(-rows // ROWS_PER_SECTION))
+    for i in range(n_sections):
+        track = TRACKS[i % len(TRACKS)]
+        wave_section = f"{i // len(TRACKS) + 1}{'ABC'[i % 3]}"
+        size = min(ROWS_PER_SECTION, rows - len(records))
+        records += synthetic_section_rows(wave_section, track, rows=size, seed=seed)
+
+    # round-trip through CSV text so dtypes and NaNs match pd.read_csv on the real files
+    buf = io.StringIO()
+    csv.writer(buf).writerows([COLUMNS] + records)
+    buf.seek(0)
+    df = pd.read_csv(buf)
+    if parsed:
+        df["section"] = df["track"] + " Section " + df["wave_section"]
+        df["date"] = parse_schedule_dates(df["date"])
+        df["date_display"] = df["date"].apply(lambda x: add_ordinal_suffix(x))
+        df[MILESTONE_DUE_COLUMN] = milestone_due_dates(df)
+    return df
@@ -1,31 +1,106 @@
-import gspread
-import pandas as pd
+import argparse
+import hashlib
+import json
 import os
-from oauth2client.service_account import ServiceAccountCredentials
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from utils.sheets import SheetsConnection, fetch_all_section_values
+
+CSV_DIR = "csv_data"
 
-# 1. Setup credentials
-scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds = ServiceAccountCredentials.from_json_keyfile_name("credentials.json", scope)
-client = gspread.authorize(creds)
 
-# 2. Open the spreadsheet
-spreadsheet = client.open("Curriculum Schedules All Tracks") 
+# -------------------------------
+# 💾 Export one worksheet
+# -------------------------------
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
 
-# 3. Create output folder
-os.makedirs("csv_data", exist_ok=True)
 
-# 4. Loop through each worksheet
-for ws in spreadsheet.worksheets():
-    name = ws.title
-    print(f"Exporting: {name}")
+def _file_sha256(path):
+    """sha256 of the file on disk, or None if it doesn't exist."""
+    try:
+        with open(path, "rb") as fh:
+            return _sha256(fh.read())
+    except FileNotFoundError:
+        return None
 
-    # Pull a limited range
-    values = ws.get_all_values("A1:I25")
+
+def _export_worksheet(name, values, out_dir, force):
+    """Write one worksheet's CSV unless the file on disk already matches. Returns (name, status)."""
     if not values:
-        continue
+        return name, "skipped"
+
+    csv_bytes = pd.DataFrame(values[1:], columns=values[0]).to_csv(index=False).encode("utf-8")
+    csv_path = os.path.join(out_dir, f"{name}.csv")
+    # compare against the file itself, so hand-edited or truncated CSVs get repaired
+    on_disk = _file_sha256(csv_path)
+
+    if on_disk is not None and not force and on_disk == _sha256(csv_bytes):
+        return name, "unchanged"
+
+    # write-then-rename so the app never reads a half-written CSV
+    with open(f"{csv_path}.tmp", "wb") as fh:
+        fh.write(csv_bytes)
+    os.replace(f"{csv_path}.tmp", csv_path)
+    return name, ("updated" if on_disk is not None else "added")
+
+
+# -------------------------------
+# 🔁 Incremental sync
+# -------------------------------
+def sync_csvs(spreadsheet, out_dir=CSV_DIR, max_workers=4, force=False, cell_range=None):
+    """
+    Export every worksheet to <out_dir>/<name>.csv, rewriting only files whose
+    content differs from what is on disk (compared by sha256).
+
+    All ranges come back from one batch request, each sized to its
+    worksheet's used cells (see utils.sheets.sheet_ranges) unless
+    `cell_range` pins one; serializing, hashing and writing each worksheet
+    then runs on a bounded thread pool.
+
+    Returns {"added": [...], "updated": [...], "unchanged": [...], "skipped": [...]}.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    all_values = fetch_all_section_values(spreadsheet, cell_range=cell_range)
+
+    summary = {"added": [], "updated": [], "unchanged": [], "skipped": []}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_export_worksheet, name, values, out_dir, force)
+            for name, values in all_values.items()
+        ]
+        for future in futures:
+            name, status = future.result()
+            summary[status].append(name)
+    return summary
+
+
+def print_summary(summary):
+    for name in summary["added"]:
+        print(f"🆕 Added {name}")
+    for name in summary["updated"]:
+        print(f"✅ Updated {name}")
+    for name in summary["skipped"]:
+        print(f"⚠️ Skipped {name} (no data)")
+    print(
+        f"{len(summary['added'])} added, {len(summary['updated'])} updated, "
+        f"{len(summary['unchanged'])} unchanged, {len(summary['skipped'])} skipped."
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export every worksheet of the curriculum spreadsheet to csv_data/.")
+    parser.add_argument("--credentials", default="credentials.json", help="service account JSON key file")
+    parser.add_argument("--out", default=CSV_DIR, help="output folder (default: csv_data)")
+    parser.add_argument("--workers", type=int, default=4, help="max export threads (default: 4)")
+    parser.add_argument("--force", action="store_true", help="rewrite every CSV even if unchanged")
+    args = parser.parse_args()
+
+    # 1. Setup credentials + open the spreadsheet
+    with open(args.credentials, encoding="utf-8") as fh:
+        connection = SheetsConnection(json.load(fh))
 
-    # Convert to DataFrame and save
-    df = pd.DataFrame(values[1:], columns=values[0])
-    csv_path = f"./csv_data/{name}.csv"
-    df.to_csv(csv_path, index=False)
-    print(f"✅ Saved to {csv_path}")
+    # 2. Sync only what changed
+    print_summary(sync_csvs(connection.spreadsheet, out_dir=args.out, max_workers=args.workers, force=args.force))
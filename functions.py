@@ -1,14 +1,21 @@
 # =========================================================
 # Imports
 # =========================================================
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+import hashlib
 import re
+import numpy as np
 import pandas as pd
 
+from utils.timing import timed
+
 try:
     from utils.edits import PROJECT_DUE_DATES, get_milestone_due_days
-except Exception:
-    PROJECT_DUE_DATES = {}
+except ImportError:
+    # only a missing edits module falls back; bad override data must surface
+    from utils.overrides import DueDateOverrides
+    PROJECT_DUE_DATES = DueDateOverrides()
     def get_milestone_due_days(_section):
         return []
     
@@ -32,9 +39,109 @@ def clean_and_parse_date(date_str, fallback_year=None):
         return None
 
 
+_WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+_WEEKDAY_INDEX = {name.lower(): i for i, name in enumerate(_WEEKDAYS)}
+# Same shape clean_and_parse_date accepts: "<weekday>, MM/DD[ anything]"
+_DATE_PATTERN = r"^(?P<weekday>.*?), \s*(?P<month>\d{1,2})/(?P<day>\d{1,2})(?:\s|$)"
+
+
+@timed("parse")
+def parse_schedule_dates(values, reference_year=None, groups=None) -> pd.Series:
+    """
+    Vectorized clean_and_parse_date for a whole column.
+
+    Parses strings like 'Monday, 09/01 SKIPPED FOR HOLIDAY!' in one pass and
+    returns a datetime64 Series (NaT where unparseable). Columns that are
+    already datetime64 are returned as-is, so callers can pass either.
+
+    The year is inferred instead of assumed: the month sequence rolls over
+    into the next year when it drops sharply (e.g. 12 -> 01), and the start
+    year is whichever of reference_year / reference_year-1 / reference_year+1
+    best matches the weekday names written in the strings. With `groups`
+    (one key per row, e.g. the section of a concatenated frame) both are
+    decided per group, so one section's rollover never shifts the next.
+    """
+    s = values if isinstance(values, pd.Series) else pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(s):
+        return s
+    if s.empty:
+        return pd.Series(index=s.index, name=s.name, dtype="datetime64[ns]")
+
+    # regex once per distinct string; everything after is integer numpy on (month, day, weekday)
+    memo = {}
+    fields = [memo[v] if v in memo else memo.setdefault(v, _date_fields(v)) for v in s.to_numpy(dtype=object)]
+    month, day, weekday = np.array(fields, dtype=float).T
+    codes = np.zeros(len(s), dtype=np.int64) if groups is None else pd.factorize(np.asarray(groups), use_na_sentinel=False)[0]
+    rollover = _year_rollovers(month, codes)
+
+    if reference_year is None:
+        reference_year = datetime.now().year
+
+    # each candidate start year is a few integer ops; keep the one whose weekdays match most
+    parsed = (month >= 1) & (month <= 12) & (day >= 1)
+    month, day = np.where(parsed, month, 1).astype(np.int64), np.where(parsed, day, 1).astype(np.int64)
+    year = np.array([[reference_year], [reference_year - 1], [reference_year + 1]]) + rollover  # one row per candidate
+    days = _days_from_civil(year, month, day)
+    valid = parsed & (day <= _days_in_month(year, month))
+    matches = valid & ((days + 3) % 7 == weekday)  # 1970-01-01 was a Thursday
+    hits = np.stack([np.bincount(codes, weights=row, minlength=codes.max() + 1) for row in matches])
+    best = np.argmax(hits, axis=0)[codes]  # ties keep the earlier candidate
+    rows = np.arange(len(s))
+    dates = np.where(valid[best, rows], days[best, rows].astype("datetime64[D]"), np.datetime64("NaT", "D"))
+    return pd.Series(dates.astype("datetime64[ns]"), index=s.index, name=s.name, copy=False)
+
+
+_DATE_RE = re.compile(_DATE_PATTERN)
+_MONTH_DAYS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+
+def _date_fields(value):
+    """(month, day, weekday index) from one date string; NaN for whatever doesn't parse."""
+    match = _DATE_RE.match(str(value))
+    if match is None:
+        return np.nan, np.nan, np.nan
+    weekday = _WEEKDAY_INDEX.get(match["weekday"].strip().lower(), np.nan)
+    return int(match["month"]), int(match["day"]), weekday
+
+
+def _days_in_month(year, month):
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    return _MONTH_DAYS[month - 1] + ((month == 2) & leap)
+
+
+def _days_from_civil(year, month, day):
+    """Days since 1970-01-01 for proleptic Gregorian year/month/day int arrays."""
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    return era * 146097 + year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year - 719468
+
+
+def _year_rollovers(month, codes) -> np.ndarray:
+    """
+    Years to add per row: the count of sharp month drops (e.g. 12 -> 01)
+    so far within the row's group, comparing each row with the last row
+    before it that has a month.
+    """
+    n = len(month)
+    order = np.arange(n) if not codes.any() else np.argsort(codes, kind="stable")
+    m, c = month[order], codes[order]
+    last = np.maximum.accumulate(np.where(np.isnan(m), -1, np.arange(n)))  # last month at or before i
+    prev = np.concatenate(([-1], last[:-1]))
+    same_group = (prev >= 0) & (c[np.maximum(prev, 0)] == c)
+    prev_month = np.where(same_group, m[np.maximum(prev, 0)], np.nan)
+    drops = (m < prev_month - 6).astype(np.int64)
+    totals = np.cumsum(drops)
+    first = np.searchsorted(c, c)  # each group's first sorted position
+    rollover = np.empty(n, dtype=np.int64)
+    rollover[order] = totals - totals[first] + drops[first]
+    return rollover
+
+
 def add_ordinal_suffix(date):
     """Adds an ordinal suffix (st, nd, rd, th) to the day of a datetime object."""
-    if date is None:
+    if date is None or pd.isna(date):
         return "Unknown Date"
     day = date.day
     if 11 <= day <= 13:
@@ -73,39 +180,385 @@ def _is_empty(val) -> bool:
     return s == "" or s.lower() in {"nan", "nat", "none", "null"}
 
 
-def _get_dt(val):
-    """Return pd.Timestamp if already datetime/TS, else try your custom parser, else None."""
-    if isinstance(val, (datetime, pd.Timestamp)):
-        return pd.Timestamp(val)
-    return clean_and_parse_date(str(val))
+def _empty_values(values) -> np.ndarray:
+    """Vectorized _is_empty for a whole column, as a plain bool array."""
+    values = np.asarray(values, dtype=object)
+    text = np.char.lower(np.char.strip(values.astype(str)))
+    return pd.isna(values) | np.isin(text, ["", "nan", "nat", "none", "null"])
+
+
+def _contains(df: pd.DataFrame, name: str, needle: str) -> np.ndarray:
+    """needle in str(value).lower() per row (all False if the column is missing)."""
+    if name not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    text = np.char.lower(df[name].to_numpy(dtype=object).astype(str))
+    return np.char.find(text, needle) >= 0
+
+
+def schedule_hash(df) -> str:
+    """Content hash of a schedule frame; cheap enough to use as a cache key every rerun."""
+    h = hashlib.sha1("|".join(map(str, df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
 
 
 def _fmt_date(d):
-    return f"{d.strftime('%A')}, {d.strftime('%m/%d')}" if d is not None else None
+    """'Monday, 09/08', or None for a missing date (None / NaT)."""
+    if d is None or pd.isna(d):
+        return None
+    return f"{d.strftime('%A')}, {d.strftime('%m/%d')}"
 
 
 # =========================================================
 # 🗓️ Friday Announcement Generator
 # =========================================================
-def generate_friday_messages(df, track, friday_date, section=None):
+@dataclass(slots=True)
+class FridayPost:
+    """Everything a Friday post says, computed without touching Streamlit."""
+    friday: pd.Timestamp
+    section: object
+    last_ll_num: object = None
+    last_ll_title: object = None
+    last_ll_date: object = None
+    has_next_lab: bool = False
+    next_ll_num: object = None
+    next_ll_title: object = None
+    next_ll_date: object = None
+    next_ll_description: object = None
+    skillbuilder_before: object = None
+    future_skillbuilder_name: object = None
+    future_skillbuilder_ll: object = None
+    future_skillbuilder_date: object = None
+    milestone_due: object = None
+    milestone_due_date: object = None
+    next_milestone: object = None
+    next_milestone_due_date: object = None
+
+    @property
+    def has_past(self) -> bool:
+        return self.last_ll_num is not None
+
+
+def _next_valid_positions(mask) -> np.ndarray:
+    """
+    For each position i, the first position j >= i where mask[j] is True.
+    One extra trailing slot (position len(mask)) is included; missing -> len(mask).
+    Computed as a reverse running minimum, i.e. a backward fill of positions.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    n = len(mask)
+    pos = np.append(np.where(mask, np.arange(n), n), n)
+    return np.minimum.accumulate(pos[::-1])[::-1]
+
+
+# =========================================================
+# 📆 Milestone Due Dates (one engine, whole columns)
+# =========================================================
+MILESTONE_DUE_COLUMN = "milestone_due_date"
+
+
+def _due_offsets(section_codes: np.ndarray) -> np.ndarray:
+    """
+    (n_codes, 7) table: days from a weekday (column, Monday=0) to the nearest
+    due weekday on/after it for each section code; -1 if the section has no due days.
+    """
+    table = np.full((len(section_codes), 7), -1)
+    weekdays = np.arange(7)
+    for i, code in enumerate(section_codes):
+        due_days = [_WEEKDAY_INDEX[day.lower()] for day in get_milestone_due_days(str(code)) or []]
+        if due_days:
+            table[i] = np.min([(d - weekdays) % 7 for d in due_days], axis=0)
+    return table
+
+
+def milestone_due_dates(df: pd.DataFrame, overrides=None) -> pd.Series:
+    """
+    Due date of each row's milestone (assignment_due_after), for a whole
+    schedule at once: the PROJECT_DUE_DATES override for (track, section,
+    title) if there is one, otherwise the row's date pushed forward to the
+    section's nearest due weekday. NaT where there is no milestone.
+    """
+    overrides = PROJECT_DUE_DATES if overrides is None else overrides
+    due = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+    if "assignment_due_after" not in df.columns:
+        return pd.Series(due, index=df.index)
+
+    # only rows that name a milestone need a date
+    titles = df["assignment_due_after"].to_numpy(dtype=object)
+    rows = np.flatnonzero(~_empty_values(titles))
+    if not len(rows):
+        return pd.Series(due, index=df.index)
+    titles = titles[rows]
+    tracks = _values_at(df, "track", rows)
+    sections = _values_at(df, "wave_section", rows)
+
+    # nearest due weekday: date + offset[section, weekday], all in datetime64 arithmetic
+    if "date" in df.columns:
+        dates = parse_schedule_dates(df["date"], groups=_section_keys(df)).to_numpy(dtype="datetime64[ns]")[rows]
+    else:
+        dates = np.full(len(rows), np.datetime64("NaT"), dtype="datetime64[ns]")
+    codes, uniques = pd.factorize(sections.astype(str))
+    weekday = (dates.astype("datetime64[D]").astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    offsets = _due_offsets(uniques)[codes, weekday]
+    computed = np.where(offsets >= 0, dates + offsets.astype("timedelta64[D]"), np.datetime64("NaT"))
+
+    # overrides, looked up for the whole column
+    keyed = ~_empty_values(tracks) & ~_empty_values(sections)
+    section_names = np.array([f"{t} Section {s}" for t, s in zip(tracks, sections)], dtype=object)
+    override = overrides.lookup_many(np.where(keyed, section_names, None), np.where(keyed, titles, None))
+
+    due[rows] = np.where(np.isnat(override), computed, override)
+    return pd.Series(due, index=df.index)
+
+
+def _section_keys(df: pd.DataFrame):
+    """Per-row section of a possibly multi-section frame (None if it doesn't say)."""
+    for name in ("section", "wave_section"):
+        if name in df.columns:
+            return df[name].to_numpy(dtype=object)
+    return None
+
+
+def _values_at(df: pd.DataFrame, name: str, rows: np.ndarray) -> np.ndarray:
+    """Object array of df[name] at `rows` (all None if the column is missing)."""
+    if name not in df.columns:
+        return np.full(len(rows), None, dtype=object)
+    return df[name].to_numpy(dtype=object)[rows]
+
+
+def _milestone_due_column(df: pd.DataFrame) -> pd.Series:
+    """The precomputed due-date column if the frame has one, else computed now."""
+    if MILESTONE_DUE_COLUMN in df.columns:
+        return df[MILESTONE_DUE_COLUMN]
+    return milestone_due_dates(df)
+
+
+def _optional(value):
+    """NaT/NaN -> None, so dataclass fields keep their 'no value' default."""
+    return None if pd.isna(value) else value
+
+
+def _group_codes(tracks, sections, groups) -> np.ndarray:
+    """Index into `groups` of each row's (track, wave_section), or -1. Two factorize calls, no MultiIndex."""
+    track_codes, track_uniques = pd.factorize(tracks)
+    section_codes, section_uniques = pd.factorize(sections)
+    track_pos = {v: i for i, v in enumerate(track_uniques)}
+    section_pos = {v: i for i, v in enumerate(section_uniques)}
+
+    lookup = np.full((len(track_uniques) + 1, len(section_uniques) + 1), -1)  # last row/col: NaN codes (-1)
+    for g, (track, sec) in enumerate(groups):
+        if track in track_pos and sec in section_pos and lookup[track_pos[track], section_pos[sec]] < 0:
+            lookup[track_pos[track], section_pos[sec]] = g
+    return lookup[track_codes, section_codes]
+
+
+def _sweep_fridays(df, fridays, groups):
+    """
+    FridayPosts for every (track, wave_section) group x Friday in one pass.
+
+    All dated rows are sorted once by (group, date); each (group, Friday) is
+    placed with a single searchsorted on a combined (group, date-rank) key,
+    and the "next SkillBuilder" / "next milestone" rows come from
+    next-non-null pointers bounded by each group's end.
+
+    Returns {(track, wave_section): [FridayPost per Friday]} in `groups` order.
+    """
+    fridays = [pd.Timestamp(f) for f in fridays]
+    friday_ns = np.array(fridays, dtype="datetime64[ns]").astype(np.int64)
+    groups = list(groups)
+    posts = {group: [FridayPost(friday=friday, section=group[1]) for friday in fridays] for group in groups}
+    if df.empty or not groups or not fridays:
+        return posts
+
+    # group code per row (-1 = not requested); keep dated rows of requested groups
+    codes = _group_codes(df["track"].to_numpy(), df["wave_section"].to_numpy(), groups)
+    keep = (codes >= 0) & df["date"].notna().to_numpy()
+    sched, codes = df[keep], codes[keep]
+    dates = sched["date"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+    # stable (group, date) order: ties keep their original row order
+    order = np.argsort(dates, kind="stable")
+    order = order[np.argsort(codes[order], kind="stable")]
+    sched, codes, dates = sched.iloc[order], codes[order], dates[order]
+    rows = sched.to_dict("records")
+    due = _milestone_due_column(sched).array  # Timestamp / NaT per row
+
+    # combined key: group * M + rank of the date among every date and Friday
+    ranks = np.unique(np.concatenate([dates, friday_ns]))
+    m = len(ranks) + 1
+    keys = codes * m + np.searchsorted(ranks, dates)
+    starts = np.searchsorted(codes, np.arange(len(groups)), side="left")
+    ends = np.searchsorted(codes, np.arange(len(groups)), side="right")
+
+    # first upcoming row for each (group, Friday); rows before it are in the past
+    queries = np.arange(len(groups))[:, None] * m + np.searchsorted(ranks, friday_ns)[None, :]
+    cuts = np.searchsorted(keys, queries, side="right")
+    next_sb = _next_valid_positions(sched["videos_watch_by"].notna().to_numpy())
+    next_ms = _next_valid_positions(sched["assignment_due_after"].notna().to_numpy())
+
+    for g, (track, sec) in enumerate(groups):
+        start, end = starts[g], ends[g]
+        for post, cut in zip(posts[(track, sec)], cuts[g]):
+            if cut == start:
+                continue
+
+            # most recent lab; ties on the same date resolve to the earliest row
+            last_pos = np.searchsorted(keys, keys[cut - 1], side="left")
+            last = rows[last_pos]
+            post.last_ll_num = last["LL_num"]
+            post.last_ll_title = last["livelab_title"]
+            post.last_ll_date = last["date"]
+
+            if cut < end:
+                next_lab = rows[cut]
+                post.has_next_lab = True
+                post.next_ll_num = next_lab["LL_num"]
+                post.next_ll_title = next_lab["livelab_title"] if pd.notna(next_lab["livelab_title"]) else "an upcoming LiveLab"
+                post.next_ll_date = next_lab["date"]
+                post.next_ll_description = next_lab["notes"] if pd.notna(next_lab["notes"]) else "No description available 😅"
+                post.skillbuilder_before = next_lab["videos_watch_by"] if pd.notna(next_lab["videos_watch_by"]) else None
+
+            if next_sb[cut] < end:
+                sb = rows[next_sb[cut]]
+                post.future_skillbuilder_name = sb["videos_watch_by"]
+                post.future_skillbuilder_ll = sb["LL_num"]
+                post.future_skillbuilder_date = sb["date"]
+
+            post.milestone_due = last.get("assignment_due_after", None)
+            post.milestone_due_date = _optional(due[last_pos])
+
+            if next_ms[cut] < end:
+                ms = rows[next_ms[cut]]
+                post.next_milestone = ms["assignment_due_after"]
+                post.next_milestone_due_date = _optional(due[next_ms[cut]])
+    return posts
+
+
+@timed("friday_loop")
+def build_friday_timeline(df, fridays, track, section=None):
+    """
+    Compute every Friday post for a track's sections (or just `section`)
+    in one sweep — see _sweep_fridays(); O(rows log rows + Fridays).
+
+    Returns one FridayPost per (section, Friday), in section then date order.
+    """
+    if section:
+        sections = [section]
+    else:
+        sections = df.loc[df["track"] == track, "wave_section"].unique()
+    by_group = _sweep_fridays(df, fridays, [(track, sec) for sec in sections])
+    return [post for posts in by_group.values() for post in posts]
+
+
+@timed("friday_loop")
+def plan_week_across_sections(df, friday):
+    """
+    One Friday's post for every section in a consolidated multi-section
+    frame, from a single grouped sweep. Returns {section name: FridayPost}.
+    """
+    if df.empty:
+        return {}
+    sections = list(df.drop_duplicates("section")[["section", "track", "wave_section"]].itertuples(index=False, name=None))
+    by_group = _sweep_fridays(df, [friday], [(track, wave) for _, track, wave in sections])
+    # each section reads its own group's post by key
+    return {name: by_group[(track, wave)][0] for name, track, wave in sections}
+
+
+def week_summary_frame(posts: dict) -> pd.DataFrame:
+    """'This week across my sections' table: one row per section from plan_week_across_sections()."""
+    rows = []
+    for name, post in posts.items():
+        # same pick as the post itself (friday_post_blocks)
+        milestone, milestone_date = (
+            (post.milestone_due, post.milestone_due_date)
+            if post.milestone_due and post.milestone_due_date and (post.next_ll_date is None or post.milestone_due_date <= post.next_ll_date)
+            else (post.next_milestone, post.next_milestone_due_date)
+        )
+        rows.append({
+            "Section": name,
+            "Last LiveLab": f"{post.last_ll_num}: {post.last_ll_title}" if post.has_past else "—",
+            "Next LiveLab": f"{post.next_ll_title} ({add_ordinal_suffix(post.next_ll_date)})" if post.has_next_lab else "—",
+            "Watch Before Next": post.skillbuilder_before or "—",
+            "Milestone": milestone if milestone and milestone_date else "—",
+            "Due": add_ordinal_suffix(milestone_date) if milestone and milestone_date else "—",
+        })
+    return pd.DataFrame(rows, columns=["Section", "Last LiveLab", "Next LiveLab", "Watch Before Next", "Milestone", "Due"])
+
+
+def friday_post_blocks(post: FridayPost):
+    """
+    The text of a Friday post as (kind, text) blocks, where kind is one of
+    'warning', 'subheader' or 'markdown'. Pure — no Streamlit needed.
+    """
+    blocks = [
+        ("warning", f'**INSTRUCTOR SANITY CHECK**: The most recent LiveLab was **{post.last_ll_num}: {post.last_ll_title}** on {add_ordinal_suffix(post.last_ll_date)}'),
+        ("subheader", """Hey everyone! 👋
+
+Thanks for hanging out with me in lab this week! Here's what's coming up ⬇️
+"""),
+    ]
+
+    if post.milestone_due and post.milestone_due_date and (post.next_ll_date is None or post.milestone_due_date <= post.next_ll_date):
+        blocks.append(("markdown", f"🎯 **Don't forget!** **:green[{post.milestone_due}]** is due on **{add_ordinal_suffix(post.milestone_due_date)}**. Swing by a drop-in session or reach out to the HelpHub with any questions!"))
+    elif post.next_milestone and post.next_milestone_due_date:
+        blocks.append(("markdown", f"🔜 **Heads up!** Your next milestone, {post.next_milestone}, is due on **{add_ordinal_suffix(post.next_milestone_due_date)}**."))
+    else:
+        blocks.append(("markdown", "ℹ️ No scheduled milestones to announce."))
+
+    if post.has_next_lab:
+        if str(post.next_ll_title).strip().lower() == "holiday":
+            blocks.append(("markdown", f"🎉 The next scheduled day, **{add_ordinal_suffix(post.next_ll_date)}**, is a holiday — there will be no LiveLab that day. Enjoy your break!"))
+        else:
+            blocks.append(("markdown", f"⏭️ Your next LiveLab is **{post.next_ll_title}** on **{add_ordinal_suffix(post.next_ll_date)}**. {post.next_ll_description}"))
+            if post.skillbuilder_before:
+                blocks.append(("markdown", f"🍿 To prepare, please be sure to watch **:blue[{post.skillbuilder_before}]** before then."))
+            elif post.future_skillbuilder_name and post.future_skillbuilder_ll:
+                blocks.append(("markdown", f"📌 While there's no SkillBuilder due before the next LiveLab, your next one will be **{post.future_skillbuilder_name}** for {post.future_skillbuilder_ll} on **{add_ordinal_suffix(post.future_skillbuilder_date)}**."))
+            else:
+                blocks.append(("markdown", "📌 No upcoming SkillBuilders found in the schedule."))
+    else:
+        blocks.append(("markdown", "⏭️ No upcoming LiveLabs scheduled."))
+
+    blocks.append(("markdown", "Have a wonderful weekend, and see you all next week!"))
+    return blocks
+
+
+def friday_post_label(post: FridayPost) -> str:
+    return f"📢 Post on **:blue[{add_ordinal_suffix(post.friday)}]**"
+
+
+def friday_post_error(post: FridayPost):
+    """Error text shown instead of the post when no LiveLab has happened yet, else None."""
+    return None if post.has_past else f"❌ No past LiveLabs for section {post.section}."
+
+
+def render_post_blocks(label, blocks):
+    """Draw a Friday post expander from its label and (kind, text) blocks."""
     import streamlit as st
 
-    def get_custom_project_due_date(milestone_title, section_code, track, override_dict):
-        if not milestone_title or not section_code or not track:
-            return None
-        if not isinstance(milestone_title, str):
-            return None
+    with st.expander(label):
+        for kind, text in blocks:
+            if kind == "warning":
+                st.warning(text, icon="🔎")
+            elif kind == "subheader":
+                st.subheader(text, anchor=False)
+            else:
+                st.markdown(text)
 
-        milestone_key = milestone_title.strip().lower()
-        section_full = f"{track} Section {section_code}".strip().lower()
 
-        for (dict_section, dict_title), due_date in override_dict.items():
-            if (
-                dict_section.strip().lower() == section_full and
-                dict_title.strip().lower() == milestone_key
-            ):
-                return due_date
-        return None
+def render_friday_post(post: FridayPost):
+    """Draw one Friday post in Streamlit."""
+    import streamlit as st
+
+    error = friday_post_error(post)
+    if error:
+        st.error(error)
+        return
+    render_post_blocks(friday_post_label(post), friday_post_blocks(post))
+
+
+def generate_friday_messages(df, track, friday_date, section=None):
+    import streamlit as st
 
     # Parse/adjust Friday date
     if isinstance(friday_date, str):
@@ -120,260 +573,212 @@ def generate_friday_messages(df, track, friday_date, section=None):
         friday_date = adjust_to_most_recent_friday(friday_date)
         st.info(f"🔄 Adjusted to most recent Friday: {add_ordinal_suffix(friday_date)}")
 
-    # Filter by track/section
-    df = df[df["track"] == track]
-    sections_to_process = [section] if section else df["wave_section"].unique()
-
-    for sec in sections_to_process:
-        section_df = df[df["wave_section"] == sec]
-        upcoming = section_df[section_df["date"] > friday_date].sort_values("date")
-        past = section_df[section_df["date"] <= friday_date].sort_values("date", ascending=False)
-
-        if past.empty:
-            st.error(f"❌ No past LiveLabs for section {sec}.")
-            continue
-
-        last = past.iloc[0]
-        last_ll_num = last["LL_num"]
-        last_ll_title = last["livelab_title"]
-        last_ll_date = last["date"]
-
-        next_lab = upcoming.iloc[0] if not upcoming.empty else None
-        if next_lab is not None:
-            next_ll_num = next_lab["LL_num"]
-            next_ll_title = next_lab["livelab_title"] if pd.notna(next_lab["livelab_title"]) else "an upcoming LiveLab"
-            next_ll_date = next_lab["date"]
-            next_ll_description = next_lab["notes"] if pd.notna(next_lab["notes"]) else "No description available 😅"
-            skillbuilder_before = next_lab["videos_watch_by"] if pd.notna(next_lab["videos_watch_by"]) else None
-        else:
-            next_ll_num = next_ll_title = next_ll_date = next_ll_description = skillbuilder_before = None
-
-        future_skillbuilder = upcoming[upcoming["videos_watch_by"].notna()].iloc[0] if not upcoming[upcoming["videos_watch_by"].notna()].empty else None
-        future_skillbuilder_name = future_skillbuilder["videos_watch_by"] if future_skillbuilder is not None else None
-        future_skillbuilder_ll = future_skillbuilder["LL_num"] if future_skillbuilder is not None else None
-        future_skillbuilder_date = future_skillbuilder["date"] if future_skillbuilder is not None else None
-
-        milestone_due = last.get("assignment_due_after", None)
-        milestone_due_date = None
-
-        # 👉 Try to override with custom project due date
-        override_due = get_custom_project_due_date(milestone_due, sec, track, PROJECT_DUE_DATES)
-        if override_due:
-            milestone_due_date = override_due
-        else:
-            if pd.notna(milestone_due):
-                due_days = get_milestone_due_days(sec)
-                for day in due_days:
-                    idx = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"].index(day)
-                    possible_due = last_ll_date + timedelta((idx - last_ll_date.weekday()) % 7)
-                    if milestone_due_date is None or possible_due < milestone_due_date:
-                        milestone_due_date = possible_due
-
-        next_milestone_lab = upcoming[upcoming["assignment_due_after"].notna()].iloc[0] if not upcoming[upcoming["assignment_due_after"].notna()].empty else None
-        next_milestone = next_milestone_due_date = None
-        if next_milestone_lab is not None:
-            next_milestone = next_milestone_lab["assignment_due_after"]
-            base_date = next_milestone_lab["date"]
-            # 🧠 Check for override for future milestone too
-            override_next_due = get_custom_project_due_date(next_milestone, sec, track, PROJECT_DUE_DATES)
-            if override_next_due:
-                next_milestone_due_date = override_next_due
-            else:
-                due_days = get_milestone_due_days(sec)
-                for day in due_days:
-                    idx = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"].index(day)
-                    possible_due = base_date + timedelta((idx - base_date.weekday()) % 7)
-                    if next_milestone_due_date is None or possible_due < next_milestone_due_date:
-                        next_milestone_due_date = possible_due
-
-        # ---------- Streamlit block ----------
-        with st.expander(f"📢 Post on **:blue[{add_ordinal_suffix(friday_date)}]**"):
-            st.warning(
-                f'**INSTRUCTOR SANITY CHECK**: The most recent LiveLab was **{last_ll_num}: {last_ll_title}** on {add_ordinal_suffix(last_ll_date)}',
-                icon="🔎"
-            )
-            st.subheader("""Hey everyone! 👋
-
-Thanks for hanging out with me in lab this week! Here's what's coming up ⬇️
-""", anchor=False)
-            if milestone_due and milestone_due_date and (next_ll_date is None or milestone_due_date <= next_ll_date):
-                st.markdown(f"🎯 **Don't forget!** **:green[{milestone_due}]** is due on **{add_ordinal_suffix(milestone_due_date)}**. Swing by a drop-in session or reach out to the HelpHub with any questions!")
-            elif next_milestone and next_milestone_due_date:
-                st.markdown(f"🔜 **Heads up!** Your next milestone, {next_milestone}, is due on **{add_ordinal_suffix(next_milestone_due_date)}**.")
-            else:
-                st.markdown("ℹ️ No scheduled milestones to announce.")
-
-            if next_lab is not None:
-                if str(next_ll_title).strip().lower() == "holiday":
-                    st.markdown(f"🎉 The next scheduled day, **{add_ordinal_suffix(next_ll_date)}**, is a holiday — there will be no LiveLab that day. Enjoy your break!")
-                else:
-                    st.markdown(f"⏭️ Your next LiveLab is **{next_ll_title}** on **{add_ordinal_suffix(next_ll_date)}**. {next_ll_description}")
-                    if skillbuilder_before:
-                        st.markdown(f"🍿 To prepare, please be sure to watch **:blue[{skillbuilder_before}]** before then.")
-                    elif future_skillbuilder_name and future_skillbuilder_ll:
-                        st.markdown(f"📌 While there's no SkillBuilder due before the next LiveLab, your next one will be **{future_skillbuilder_name}** for {future_skillbuilder_ll} on **{add_ordinal_suffix(future_skillbuilder_date)}**.")
-                    else:
-                        st.markdown("📌 No upcoming SkillBuilders found in the schedule.")
-            else:
-                st.markdown("⏭️ No upcoming LiveLabs scheduled.")
-
-            st.markdown("Have a wonderful weekend, and see you all next week!")
+    for post in build_friday_timeline(df, [friday_date], track, section=section):
+        render_friday_post(post)
 
 
 # =========================================================
 # 🧩 Split into Part 1 & Part 2 by LL reset (LL restarts at 1)
 # =========================================================
-def split_by_part_ll_reset(df: pd.DataFrame, max_parts: int = 2):
+def _part_order(df: pd.DataFrame, groups=None, max_parts=None):
     """
-    Split a schedule into sequential parts, flipping to the next part the first
-    time LL_num resets downward (e.g., 12 -> 1). Handles real datetimes or
-    'Monday, 09/01 ...' strings.
-
-    Returns: (part1_df, part2_df)
+    (order, part): row positions in date order — within each of `groups`
+    (one key per row) when given — and the part number of each ordered row.
+    A part starts at every LL below the last LL seen before it.
     """
-    out = df.copy()
+    n = len(df)
+    if "LL_num" in df.columns:
+        ll = df["LL_num"].astype(str).str.extract(r"(\d+)", expand=False).astype(float).to_numpy()
+    else:
+        ll = np.full(n, np.nan)
 
-    # numeric LL index (NaN if missing)
-    if "LL_num" in out.columns:
-        out["ll_index"] = (
-            out["LL_num"].astype(str).str.extract(r"(\d+)", expand=False).astype(float)
-        )
+    # robust date -> datetime64 (no-op if already parsed); stable, NaT last, original order breaks ties
+    if "date" in df.columns:
+        dates = parse_schedule_dates(df["date"], groups=groups).to_numpy(dtype="datetime64[ns]")
+        order = np.argsort(dates, kind="stable")
     else:
-        out["ll_index"] = pd.Series([float("nan")] * len(out))
+        order = np.arange(n)
 
-    # robust date -> Timestamp/NaT
-    out["_dt"] = (
-        out["date"].apply(lambda v: pd.Timestamp(v) if isinstance(v, (pd.Timestamp, datetime)) else (_get_dt(v) or pd.NaT))
-        if "date" in out.columns else pd.NaT
-    )
+    # part = 1 + number of resets so far (per group), where a reset is an LL below the last seen LL
+    if groups is None:
+        ll = pd.Series(ll[order])
+        resets = ll.notna() & (ll < ll.ffill().shift())
+        part = 1 + resets.cumsum().to_numpy()
+    else:
+        codes = pd.factorize(np.asarray(groups))[0]
+        order = order[np.argsort(codes[order], kind="stable")]
+        keys = codes[order]
+        ll = pd.Series(ll[order])
+        resets = ll.notna() & (ll < ll.groupby(keys).ffill().groupby(keys).shift())
+        part = 1 + resets.groupby(keys).cumsum().to_numpy()
+    if max_parts is not None:
+        part = np.minimum(part, max_parts)
+    return order, part
+
+
+@timed("split")
+def split_schedule_parts(df: pd.DataFrame, max_parts=None) -> dict:
+    """
+    Split a schedule into sequential parts in one vectorized pass: rows are
+    put in date order and every downward LL_num reset (e.g., 12 -> 1) starts
+    a new part, up to `max_parts` (None = no limit). Handles real datetimes
+    or 'Monday, 09/01 ...' strings; the input frame is never copied whole.
 
-    # keep original order as tie-breaker; stable sort avoids RangeIndex KeyError
-    out = out.reset_index(drop=False).rename(columns={"index": "_orig_order"})
-    out = out.sort_values(by=["_dt", "_orig_order"], kind="stable").reset_index(drop=True)
+    Returns: {part number: frame in date order}, parts numbered from 1.
+    """
+    order, part = _part_order(df, max_parts=max_parts)
+    parts = {}
+    for k in np.unique(part):
+        positions = np.flatnonzero(part == k)
+        frame = df.iloc[order[positions]]
+        frame.index = positions  # row position in date order, as before
+        parts[int(k)] = frame
+    return parts
 
-    # walk rows; bump part when LL resets downward (e.g., 12 -> 1)
-    part = 1
-    prev_ll = None
-    parts = []
-    for ll in out["ll_index"]:
-        if prev_ll is not None and pd.notna(ll):
-            if ll < prev_ll and part < max_parts:
-                part += 1
-        parts.append(part)
-        if pd.notna(ll):
-            prev_ll = ll
 
-    out["part"] = parts
+def split_by_part_ll_reset(df: pd.DataFrame, max_parts: int = 2):
+    """
+    Two-part form of split_schedule_parts(): flips to Part 2 the first time
+    LL_num resets downward and keeps everything after it there.
 
-    p1 = out[out["part"] == 1].drop(columns=["_dt", "_orig_order", "ll_index", "part"], errors="ignore")
-    p2 = out[out["part"] == 2].drop(columns=["_dt", "_orig_order", "ll_index", "part"], errors="ignore")
-    return p1, p2
+    Returns: (part1_df, part2_df)
+    """
+    parts = split_schedule_parts(df, max_parts=max_parts)
+    empty = df.iloc[:0]
+    return parts.get(1, empty), parts.get(2, empty)
 
 
 # =========================================================
 # 🧾 Watch-by Markdown builders
 # =========================================================
-def _build_watch_markdown_core(df_part: pd.DataFrame, intro_header: str, intro_body: str) -> str:
+_WATCH_CLOSING = (
+    "Remember, your Watched Video Lesson score is the percentage of assigned SkillBuilder "
+    "videos you've completed so far. It updates once a day to help you keep track of your progress."
+)
+_WATCH_INTROS = {
+    1: (
+        "### Hey everyone! 👋",
+        "As promised, here is this handy guide for when your SkillBuilders should be viewed before each LiveLab. "
+        "Please use this as a reference, but don't you worry, the Team and I will remind you as we go. "
+        "The date you see is the date you need to have seen them by! Remember: you can always come back and "
+        "watch these videos to make up your Watched Video Lecture score!",
+    ),
+    2: (
+        "### Welcome back! 👋",
+        "Time to switch gears into the next phase of this experience! "
+        "Below is your new watch-by guide. The date shown is your deadline "
+        "to be ready before each LiveLab.",
+    ),
+}
+
+
+def _watch_lines(df: pd.DataFrame, groups=None) -> pd.Series:
     """
-    Core builder used by both parts. No splitting on '&'.
-    Skips rows where videos_watch_by or livelab_title is empty.
+    '- Watch <videos> <when>' bullet per row (None where videos_watch_by or
+    livelab_title is empty), built column-wise. No splitting on '&'.
+    `groups` (one key per row) keeps each section's dates to its own years.
     """
-    closing = (
-        "Remember, your Watched Video Lesson score is the percentage of assigned SkillBuilder "
-        "videos you've completed so far. It updates once a day to help you keep track of your progress."
+    if "videos_watch_by" not in df.columns or "livelab_title" not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
+
+    # masks and strings as numpy arrays: the per-op cost of Series would dominate 25-row sections
+    dates = parse_schedule_dates(df["date"], groups=groups) if "date" in df.columns else pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+    has_date = dates.notna().to_numpy()
+    day = dates.dt.strftime("%A, %m/%d").fillna("").to_numpy(dtype=object)
+    is_holiday = _contains(df, "livelab_title", "holiday") | _contains(df, "notes", "no livelab")
+    has_ll = ~_empty_values(df["LL_num"]) if "LL_num" in df.columns else np.zeros(len(df), dtype=bool)
+
+    when = np.where(
+        has_date & is_holiday, "by " + day + " (no LiveLab but this will help you stay on track!)",
+        np.where(has_date & has_ll, "by LiveLab on " + day,
+                 np.where(has_date, "by " + day, "ASAP if you haven't yet!")),
     )
+    vids = df["videos_watch_by"].to_numpy(dtype=object)
+    lines = "- Watch " + np.char.strip(vids.astype(str)).astype(object) + " " + when
+    keep = ~(_empty_values(vids) | _empty_values(df["livelab_title"]))
+    return pd.Series(np.where(keep, lines, None), index=df.index, dtype=object)
 
-    lines = []
-    for _, row in df_part.iterrows():
-        vids = row.get("videos_watch_by")
-        livelab = row.get("livelab_title")
-        if _is_empty(vids) or _is_empty(livelab):
-            continue
-
-        dt = _get_dt(row.get("date"))
-        notes = str(row.get("notes", "") or "")
-        is_holiday = "holiday" in str(livelab).lower() or "no livelab" in notes.lower()
-        has_ll = not _is_empty(row.get("LL_num"))
-
-        if is_holiday and _fmt_date(dt):
-            when = f"by {_fmt_date(dt)} (no LiveLab but this will help you stay on track!)"
-        elif has_ll and _fmt_date(dt):
-            when = f"by LiveLab on {_fmt_date(dt)}"
-        elif _fmt_date(dt):
-            when = f"by {_fmt_date(dt)}"
-        else:
-            when = "ASAP if you haven't yet!"
 
-        lines.append(f"- Watch {str(vids).strip()} {when}")
+def _watch_markdown_text(lines: str, intro_header: str, intro_body: str) -> str:
+    return "\n\n".join([intro_header, intro_body, "**📆 SkillBuilder Schedule**", lines, _WATCH_CLOSING])
 
-    return "\n\n".join([intro_header, intro_body, "**📆 SkillBuilder Schedule**", "\n".join(lines), closing])
+
+@timed("watch_markdown")
+def _build_watch_markdown_core(df_part: pd.DataFrame, intro_header: str, intro_body: str) -> str:
+    """
+    Core builder used by every part. No splitting on '&'.
+    Skips rows where videos_watch_by or livelab_title is empty.
+    """
+    return _watch_markdown_text("\n".join(_watch_lines(df_part).dropna()), intro_header, intro_body)
 
 
 def build_watch_markdown_part1(df_part: pd.DataFrame) -> str:
-    intro_header = "### Hey everyone! 👋"
-    intro_body = (
-        "As promised, here is this handy guide for when your SkillBuilders should be viewed before each LiveLab. "
-        "Please use this as a reference, but don't you worry, the Team and I will remind you as we go. "
-        "The date you see is the date you need to have seen them by! Remember: you can always come back and "
-        "watch these videos to make up your Watched Video Lecture score!"
-    )
-    return _build_watch_markdown_core(df_part, intro_header, intro_body)
+    return _build_watch_markdown_core(df_part, *_WATCH_INTROS[1])
 
 
 def build_watch_markdown_part2(df_part: pd.DataFrame) -> str:
-    intro_header = "### Welcome back! 👋"
-    intro_body = (
-        "Time to switch gears into the next phase of this experience! "
-        "Below is your new watch-by guide. The date shown is your deadline "
-        "to be ready before each LiveLab."
-    )
-    return _build_watch_markdown_core(df_part, intro_header, intro_body)
+    return _build_watch_markdown_core(df_part, *_WATCH_INTROS[2])
+
+
+def build_watch_markdown(df_part: pd.DataFrame, part: int) -> str:
+    """Watch-by guide for any part: Part 1 gets the intro, every later part the 'Welcome back' one."""
+    return build_watch_markdown_part1(df_part) if part == 1 else build_watch_markdown_part2(df_part)
+
+
+@timed("watch_markdown")
+def build_watch_guides(df: pd.DataFrame, by: str = "section", max_parts=None) -> dict:
+    """
+    Watch-by guides for many sections at once from one concatenated frame:
+    {section: {part: Markdown}}, the same text build_watch_markdown() gives
+    each section's split_schedule_parts() parts. Bullets are built for all
+    rows in one pass, then joined per (section, part).
+    """
+    keys = df[by].to_numpy()
+    order, part = _part_order(df, groups=keys, max_parts=max_parts)
+    ordered = pd.DataFrame({
+        "key": keys[order],
+        "part": part,
+        "line": _watch_lines(df, groups=keys).to_numpy()[order],
+    })
+    joined = ordered.groupby(["key", "part"], sort=False)["line"].agg(lambda lines: "\n".join(lines.dropna()))
+
+    guides = {}
+    for (key, k), lines in joined.items():
+        guides.setdefault(key, {})[int(k)] = _watch_markdown_text(lines, *_WATCH_INTROS[min(int(k), 2)])
+    return guides
 
 
 # =========================================================
 # 📝 End-of-LiveLab Reminders
 # =========================================================
-def render_end_of_livelab_reminders(df, track=None, section=None):
+@dataclass(slots=True)
+class LabReminder:
+    """What to tell students at the end of one LiveLab, computed without touching Streamlit."""
+    ll_num: object
+    title: object
+    date: object
+    has_next_lab: bool = False
+    next_title: object = None
+    next_date: object = None
+    skillbuilder: object = None
+    head_start_skillbuilder: object = None
+    head_start_title: object = None
+    head_start_date: object = None
+    milestone: object = None
+    milestone_due: object = None
+    next_milestone: object = None
+    next_milestone_due: object = None
+
+
+@timed("reminders")
+def plan_end_of_livelab_reminders(df, track=None, section=None):
     """
-    Streamlit expanders:
-      'At the end of <LiveLab Name>' showing:
+    One LabReminder per real (non-holiday, titled) LiveLab:
         • SkillBuilder to watch before the next LiveLab (or head-start suggestion)
         • Milestone due before the next LiveLab (with computed due date)
     """
-    import streamlit as st
-    from datetime import timedelta
-
-    def _is_holiday(row):
-        return "holiday" in str(row.get("livelab_title", "")).lower() or \
-               "no livelab" in str(row.get("notes", "")).lower()
-
-    def _override_due(milestone_title, section_code, track_name):
-        if _is_empty(milestone_title) or _is_empty(section_code) or _is_empty(track_name):
-            return None
-        key_title = str(milestone_title).strip().lower()
-        key_section = f"{track_name} Section {section_code}".strip().lower()
-        for (dict_section, dict_title), due in PROJECT_DUE_DATES.items():
-            if dict_section.strip().lower() == key_section and dict_title.strip().lower() == key_title:
-                return due
-        return None
-
-    def _compute_due_date(base_date, section_code, milestone_title, track_name):
-        override = _override_due(milestone_title, section_code, track_name)
-        if override:
-            return override
-        if _is_empty(milestone_title) or base_date is None:
-            return None
-        days = get_milestone_due_days(section_code) or []
-        best = None
-        for day in days:
-            idx = ["Monday","Tuesday","Wednesday","Thursday","Friday","Saturday","Sunday"].index(day)
-            cand = base_date + timedelta((idx - base_date.weekday()) % 7)
-            if best is None or cand < best:
-                best = cand
-        return best
-
     # scope to current track/section if provided
-    _df = df.copy()
+    _df = df
     if track is not None:
         _df = _df[_df["track"] == track]
     if section is not None:
@@ -382,78 +787,186 @@ def render_end_of_livelab_reminders(df, track=None, section=None):
         elif "section" in _df.columns:
             _df = _df[_df["section"] == section]
 
-    # sort & keep only real (non-holiday) labs with titles
-    _df["_dt"] = _df["date"].apply(_get_dt)
-    sched = (
-        _df.sort_values("_dt")
-            .loc[~_df.apply(_is_holiday, axis=1)]
-            .loc[~_df["livelab_title"].apply(_is_empty)]
-            .reset_index(drop=True)
-    )
-    if sched.empty:
-        st.info("No LiveLabs found to build end-of-lab reminders.")
-        return
+    # keep only real (non-holiday) labs with titles, sorted by date
+    is_holiday = _contains(_df, "livelab_title", "holiday") | _contains(_df, "notes", "no livelab")
+    keep = ~is_holiday & ~_empty_values(_df["livelab_title"])
+    sched = _df.assign(_dt=parse_schedule_dates(_df["date"], groups=_section_keys(_df)), _due=_milestone_due_column(_df)).loc[keep]
+    sched = sched.sort_values("_dt", kind="stable").reset_index(drop=True)
 
-    for i in range(len(sched)):
-        row = sched.iloc[i]
-        curr_title = row["livelab_title"]
-        curr_date  = row["_dt"]
-        sec_code   = str(row.get("wave_section", row.get("section", "")))
-        track_name = str(row.get("track", ""))
+    rows = sched.to_dict("records")
+    n = len(rows)
+    # next_sb[j] / next_ms[j]: first row at or after j with a SkillBuilder / milestone
+    next_sb = _next_valid_positions(~_empty_values(sched["videos_watch_by"]))
+    next_ms = _next_valid_positions(~_empty_values(sched["assignment_due_after"]))
 
-        # find next non-holiday lab
-        next_row = sched.iloc[i+1] if i+1 < len(sched) else None
-        next_title = next_row["livelab_title"] if next_row is not None else None
-        next_date  = _get_dt(next_row["date"]) if next_row is not None else None
+    reminders = []
+    for i, row in enumerate(rows):
+        curr_date  = row["_dt"]
+        rem = LabReminder(ll_num=row["LL_num"], title=row["livelab_title"], date=curr_date)
+        reminders.append(rem)
 
-        bullets = []
+        # next non-holiday lab
+        next_row = rows[i+1] if i+1 < n else None
+        next_date  = next_row["_dt"] if next_row is not None else None
 
         # -------- SkillBuilder due before next LL --------
         if next_row is not None:
+            rem.has_next_lab = True
+            rem.next_title = next_row["livelab_title"]
+            rem.next_date = next_date
             sb_due = next_row.get("videos_watch_by")
             if not _is_empty(sb_due):
-                bullets.append(f"🎬 **Watch** *{str(sb_due).strip()}* **before** **LL: {next_title}** on **{add_ordinal_suffix(next_date)}**.")
-            else:
+                rem.skillbuilder = str(sb_due).strip()
+            elif next_sb[i+2] < n:
                 # head start on first later SB
-                later = None
-                for j in range(i+2, len(sched)):
-                    r = sched.iloc[j]
-                    if not _is_empty(r.get("videos_watch_by")):
-                        later = r
-                        break
-                if later is not None:
-                    bullets.append(
-                        f"🎬 No SkillBuilder due before the next LiveLab — **get a head start** on "
-                        f"_{later['videos_watch_by']}_ (you’ll want this before **LL: {later['livelab_title']}** on "
-                        f"**{add_ordinal_suffix(_get_dt(later['date']))}**)."
-                    )
-        else:
-            bullets.append("🎬 No upcoming LiveLab — you’re at the end of the schedule. 🎉")
+                later = rows[next_sb[i+2]]
+                rem.head_start_skillbuilder = later["videos_watch_by"]
+                rem.head_start_title = later["livelab_title"]
+                rem.head_start_date = later["_dt"]
 
         # -------- Milestone due before next LL --------
         ms_title = row.get("assignment_due_after")
-        ms_due   = _compute_due_date(curr_date, sec_code, ms_title, track_name) if not _is_empty(ms_title) else None
+        ms_due   = _optional(row["_due"])
 
         if ms_due is not None and (next_date is None or ms_due <= next_date):
-            bullets.append(f"📌 **Milestone:** _{ms_title}_ is due **{add_ordinal_suffix(ms_due)}**.")
-        else:
+            rem.milestone = ms_title
+            rem.milestone_due = ms_due
+        elif next_ms[i+1] < n:
             # head start on next milestone
-            later_ms = None
-            for j in range(i+1, len(sched)):
-                r = sched.iloc[j]
-                if not _is_empty(r.get("assignment_due_after")):
-                    later_ms = r
-                    break
-            if later_ms is not None:
-                lm_title = later_ms["assignment_due_after"]
-                lm_due   = _compute_due_date(_get_dt(later_ms["date"]), sec_code, lm_title, track_name)
-                if lm_due is not None:
-                    bullets.append(f"📌 No milestone due before the next LiveLab — **get a head start** on _{lm_title}_ due **{add_ordinal_suffix(lm_due)}**.")
-
-        # -------- render --------
-        with st.expander(f"📝 At the end of :violet[**{row['LL_num']} {curr_title}**] on *{_fmt_date(curr_date)}*"):
-            if bullets:
-                st.markdown("\n\n".join(f"- {b}" for b in bullets))
-            else:
-                st.markdown("- Nothing due — nice work! 🎉")
+            later_ms = rows[next_ms[i+1]]
+            rem.next_milestone = later_ms["assignment_due_after"]
+            rem.next_milestone_due = _optional(later_ms["_due"])
+
+    return reminders
+
+
+def reminder_bullets(rem: LabReminder):
+    """The bullet lines for one LabReminder. Pure — no Streamlit needed."""
+    bullets = []
+
+    if not rem.has_next_lab:
+        bullets.append("🎬 No upcoming LiveLab — you’re at the end of the schedule. 🎉")
+    elif rem.skillbuilder:
+        bullets.append(f"🎬 **Watch** *{rem.skillbuilder}* **before** **LL: {rem.next_title}** on **{add_ordinal_suffix(rem.next_date)}**.")
+    elif rem.head_start_skillbuilder is not None:
+        bullets.append(
+            f"🎬 No SkillBuilder due before the next LiveLab — **get a head start** on "
+            f"_{rem.head_start_skillbuilder}_ (you’ll want this before **LL: {rem.head_start_title}** on "
+            f"**{add_ordinal_suffix(rem.head_start_date)}**)."
+        )
+
+    if rem.milestone_due is not None:
+        bullets.append(f"📌 **Milestone:** _{rem.milestone}_ is due **{add_ordinal_suffix(rem.milestone_due)}**.")
+    elif rem.next_milestone_due is not None:
+        bullets.append(f"📌 No milestone due before the next LiveLab — **get a head start** on _{rem.next_milestone}_ due **{add_ordinal_suffix(rem.next_milestone_due)}**.")
+
+    return bullets
+
+
+def reminder_label(rem: LabReminder) -> str:
+    return f"📝 At the end of :violet[**{rem.ll_num} {rem.title}**] on *{_fmt_date(rem.date)}*"
+
+
+def reminder_body(rem: LabReminder) -> str:
+    bullets = reminder_bullets(rem)
+    if bullets:
+        return "\n\n".join(f"- {b}" for b in bullets)
+    return "- Nothing due — nice work! 🎉"
+
+
+def render_reminder_text(label, body):
+    """Draw an end-of-LiveLab reminder expander from its label and Markdown body."""
+    import streamlit as st
+
+    with st.expander(label):
+        st.markdown(body)
+
+
+def render_lab_reminder(rem: LabReminder):
+    """Draw one end-of-LiveLab reminder in Streamlit."""
+    render_reminder_text(reminder_label(rem), reminder_body(rem))
+
+
+def render_end_of_livelab_reminders(df, track=None, section=None, reminders=None):
+    """
+    Streamlit expanders:
+      'At the end of <LiveLab Name>' showing:
+        • SkillBuilder to watch before the next LiveLab (or head-start suggestion)
+        • Milestone due before the next LiveLab (with computed due date)
+
+    Pass precomputed `reminders` (e.g. from a cached AnnouncementPlan) to skip planning.
+    """
+    import streamlit as st
+
+    if reminders is None:
+        reminders = plan_end_of_livelab_reminders(df, track=track, section=section)
+    if not reminders:
+        st.info("No LiveLabs found to build end-of-lab reminders.")
+        return
+
+    for rem in reminders:
+        render_lab_reminder(rem)
+
+
+# =========================================================
+# 🧠 Announcement Plan (cacheable, Streamlit-free)
+# =========================================================
+@dataclass(slots=True)
+class AnnouncementPlan:
+    """All Friday posts and end-of-lab reminders for one section."""
+    section: object
+    track: object
+    friday_posts: list = field(default_factory=list)
+    reminders: list = field(default_factory=list)
+
+
+def plan_announcements(df) -> AnnouncementPlan:
+    """Build the full AnnouncementPlan for a single-section schedule frame."""
+    section = df["wave_section"].iloc[0] if "wave_section" in df.columns and not df.empty else None
+    track = df["track"].iloc[0] if "track" in df.columns and not df.empty else None
+
+    friday_posts = []
+    if df["date"].notna().any():
+        start_date = df["date"].min()
+        end_date = df["date"].max() + pd.Timedelta(days=7)
+        fridays = get_fridays_between(start_date, end_date)
+        friday_posts = build_friday_timeline(df, fridays, track, section=section)
+
+    reminders = plan_end_of_livelab_reminders(df, track=track, section=section)
+    return AnnouncementPlan(section=section, track=track, friday_posts=friday_posts, reminders=reminders)
+
+
+# =========================================================
+# 🖨️ Plain Markdown Export (CLI, bots, LMS)
+# =========================================================
+_COLOR_DIRECTIVE = re.compile(r":[a-z]+(?:-background)?\[([^\[\]]*)\]")
+
+
+def strip_streamlit_colors(text: str) -> str:
+    """':blue-background[:blue[**x**]]' -> '**x**' so the text reads right outside Streamlit."""
+    prev = None
+    while prev != text:
+        prev, text = text, _COLOR_DIRECTIVE.sub(r"\1", text)
+    return text
+
+
+def friday_post_markdown(post: FridayPost) -> str:
+    """One Friday post as a standalone Markdown section."""
+    heading = f"## 📢 Post on {add_ordinal_suffix(post.friday)}"
+    if not post.has_past:
+        return f"{heading}\n\n❌ No past LiveLabs for section {post.section}."
+
+    parts = [heading]
+    for kind, text in friday_post_blocks(post):
+        if kind == "warning":
+            parts.append(f"> 🔎 {text}")
+        else:
+            parts.append(text.strip())
+    return strip_streamlit_colors("\n\n".join(parts))
+
 
+def reminder_markdown(rem: LabReminder) -> str:
+    """One end-of-LiveLab reminder as a standalone Markdown section."""
+    bullets = reminder_bullets(rem) or ["Nothing due — nice work! 🎉"]
+    heading = f"## 📝 At the end of {rem.ll_num} {rem.title} on {_fmt_date(rem.date)}"
+    return strip_streamlit_colors("\n\n".join([heading, "\n".join(f"- {b}" for b in bullets)]))
@@ -0,0 +1,98 @@
+"""
+Headless bulk announcement generator.
+
+Renders every section's Friday posts, SkillBuilder watch-by guides and
+end-of-LiveLab reminders to Markdown and/or JSON files without opening the
+Streamlit app, fanning sections out across a process pool.
+
+    python generate_announcements.py                      # all sections -> announcements/*.md
+    python generate_announcements.py --format json --out out/
+    python generate_announcements.py --sections "DA Section 1A" "RT Section 3A"
+    python generate_announcements.py --artifacts          # pre-render for the app -> artifacts/v2/
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.artifacts import ARTIFACT_DIR, artifact_key, render_section, save_artifact
+from utils.snapshot import CSV_DIR, SNAPSHOT_PATH, load_snapshot
+from utils.store import ScheduleStore
+
+OUT_DIR = "announcements"
+
+
+# -------------------------------
+# 🧾 Render + write one section
+# -------------------------------
+def _write_section(args):
+    name, df, out_dir, formats, source_sha256 = args
+    rendered = render_section(name, df)
+    written = []
+    if source_sha256 is not None:
+        written.append(save_artifact(name, artifact_key(source_sha256), rendered, root=out_dir))
+    if "md" in formats:
+        path = os.path.join(out_dir, f"{name}.md")
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(rendered["markdown"])
+        written.append(path)
+    if "json" in formats:
+        path = os.path.join(out_dir, f"{name}.json")
+        payload = {k: v for k, v in rendered.items() if k != "markdown"}
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False, indent=2)
+        written.append(path)
+    return name, written
+
+
+# -------------------------------
+# 🚀 Bulk run
+# -------------------------------
+def generate_all(sections, out_dir=OUT_DIR, formats=("md",), workers=None, hashes=None):
+    """
+    Render {name: DataFrame} sections to files in out_dir, one process per
+    section (workers=1 renders in-process). Returns {name: [paths]}.
+
+    With `hashes` ({name: source CSV sha256}) each render is written as a
+    versioned artifact under out_dir instead (see utils/artifacts.py).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    hashes = hashes or {}
+    jobs = [(name, df, out_dir, tuple(formats), hashes.get(name)) for name, df in sections.items()]
+    if workers == 1 or len(jobs) <= 1:
+        return dict(map(_write_section, jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_write_section, jobs))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every section's announcements without the Streamlit UI.")
+    parser.add_argument("--csv-dir", default=CSV_DIR, help="folder of section CSVs (default: csv_data)")
+    parser.add_argument("--out", default=OUT_DIR, help="output folder (default: announcements)")
+    parser.add_argument("--format", choices=["md", "json", "both"], default="md")
+    parser.add_argument("--workers", type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument("--sections", nargs="*", help="only these sections (default: all)")
+    parser.add_argument("--artifacts", action="store_true", help="write versioned artifacts for the app (default out: artifacts)")
+    args = parser.parse_args()
+
+    snapshot_path = os.path.join(args.csv_dir, os.path.basename(SNAPSHOT_PATH))
+    store = ScheduleStore(load_snapshot(args.csv_dir, snapshot_path))
+    sections = {name: store[name] for name in store}
+    if args.sections:
+        missing = sorted(set(args.sections) - set(sections))
+        if missing:
+            parser.error(f"unknown section(s): {', '.join(missing)}")
+        sections = {name: sections[name] for name in args.sections}
+
+    if args.artifacts:
+        out_dir = args.out if args.out != OUT_DIR else ARTIFACT_DIR
+        formats, hashes = (), store.hashes
+    else:
+        out_dir = args.out
+        formats, hashes = (("md", "json") if args.format == "both" else (args.format,)), None
+
+    started = time.perf_counter()
+    results = generate_all(sections, out_dir=out_dir, formats=formats, workers=args.workers, hashes=hashes)
+    elapsed = time.perf_counter() - started
+    print(f"✅ Rendered {len(results)} sections to {out_dir}/ in {elapsed:.2f}s")
@@ -0,0 +1,121 @@
+"""
+The row-by-row code paths the vectorized builders replaced, kept as
+references for the regression tests. They trade speed for being easy to
+check by eye against the original implementations.
+"""
+import os
+from datetime import timedelta
+
+import pandas as pd
+
+from functions import (
+    _WATCH_CLOSING,
+    _WATCH_INTROS,
+    PROJECT_DUE_DATES,
+    FridayPost,
+    _fmt_date,
+    _is_empty,
+    get_milestone_due_days,
+)
+from utils.snapshot import _csv_names, _load_section_csv
+
+CSV_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "csv_data")
+WEEKDAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def shipped_sections():
+    """{section name: parsed frame} for every CSV in csv_data/."""
+    return {name: _load_section_csv(os.path.join(CSV_DIR, f"{name}.csv"), name) for name in _csv_names(CSV_DIR)}
+
+
+def _due_date(title, base_date, track, sec):
+    override = PROJECT_DUE_DATES.lookup(f"{track} Section {sec}", title)
+    if override:
+        return override
+    due = None
+    for day in get_milestone_due_days(sec):
+        possible = base_date + timedelta((WEEKDAYS.index(day) - base_date.weekday()) % 7)
+        if due is None or possible < due:
+            due = possible
+    return due
+
+
+def friday_post(df, track, sec, friday):
+    """One section's FridayPost the way generate_friday_messages used to find it: filter, sort, take the first row."""
+    post = FridayPost(friday=pd.Timestamp(friday), section=sec)
+    section_df = df[(df["track"] == track) & (df["wave_section"] == sec)]
+    upcoming = section_df[section_df["date"] > friday].sort_values("date", kind="stable")
+    past = section_df[section_df["date"] <= friday].sort_values("date", ascending=False, kind="stable")
+    if past.empty:
+        return post
+
+    last = past.iloc[0]
+    post.last_ll_num, post.last_ll_title, post.last_ll_date = last["LL_num"], last["livelab_title"], last["date"]
+
+    if not upcoming.empty:
+        next_lab = upcoming.iloc[0]
+        post.has_next_lab = True
+        post.next_ll_num = next_lab["LL_num"]
+        post.next_ll_title = next_lab["livelab_title"] if pd.notna(next_lab["livelab_title"]) else "an upcoming LiveLab"
+        post.next_ll_date = next_lab["date"]
+        post.next_ll_description = next_lab["notes"] if pd.notna(next_lab["notes"]) else "No description available 😅"
+        post.skillbuilder_before = next_lab["videos_watch_by"] if pd.notna(next_lab["videos_watch_by"]) else None
+
+    skillbuilders = upcoming[upcoming["videos_watch_by"].notna()]
+    if not skillbuilders.empty:
+        sb = skillbuilders.iloc[0]
+        post.future_skillbuilder_name, post.future_skillbuilder_ll, post.future_skillbuilder_date = (
+            sb["videos_watch_by"], sb["LL_num"], sb["date"]
+        )
+
+    post.milestone_due = last.get("assignment_due_after", None)
+    if pd.notna(post.milestone_due):
+        post.milestone_due_date = _due_date(post.milestone_due, post.last_ll_date, track, sec)
+
+    milestones = upcoming[upcoming["assignment_due_after"].notna()]
+    if not milestones.empty:
+        ms = milestones.iloc[0]
+        post.next_milestone = ms["assignment_due_after"]
+        post.next_milestone_due_date = _due_date(post.next_milestone, ms["date"], track, sec)
+    return post
+
+
+def split_parts(df, max_parts=2):
+    """The original split_by_part_ll_reset walk: sort by (date, row), bump the part when LL_num drops."""
+    out = df.assign(_ll=df["LL_num"].astype(str).str.extract(r"(\d+)", expand=False).astype(float))
+    out = out.reset_index(drop=True).reset_index(names="_row").sort_values(["date", "_row"], kind="stable")
+
+    part, prev_ll, parts = 1, None, []
+    for ll in out["_ll"]:
+        if prev_ll is not None and pd.notna(ll) and ll < prev_ll and part < max_parts:
+            part += 1
+        parts.append(part)
+        if pd.notna(ll):
+            prev_ll = ll
+    out = out.drop(columns=["_row", "_ll"])
+    return [out[[p == k for p in parts]] for k in range(1, max_parts + 1)]
+
+
+def watch_markdown(df_part, part):
+    """The original iterrows watch-by guide for one part."""
+    lines = []
+    for _, row in df_part.iterrows():
+        vids, livelab = row.get("videos_watch_by"), row.get("livelab_title")
+        if _is_empty(vids) or _is_empty(livelab):
+            continue
+
+        day = _fmt_date(row["date"])
+        notes = str(row.get("notes", "") or "")
+        is_holiday = "holiday" in str(livelab).lower() or "no livelab" in notes.lower()
+        if is_holiday and day:
+            when = f"by {day} (no LiveLab but this will help you stay on track!)"
+        elif not _is_empty(row.get("LL_num")) and day:
+            when = f"by LiveLab on {day}"
+        elif day:
+            when = f"by {day}"
+        else:
+            when = "ASAP if you haven't yet!"
+        lines.append(f"- Watch {str(vids).strip()} {when}")
+
+    intro_header, intro_body = _WATCH_INTROS[min(part, 2)]
+    return "\n\n".join([intro_header, intro_body, "**📆 SkillBuilder Schedule**", "\n".join(lines), _WATCH_CLOSING])
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from functions import milestone_due_dates, parse_schedule_dates
+from utils.overrides import DueDateOverrides
+
+
+def dates(*values):
+    return [pd.Timestamp(v) if v else pd.NaT for v in values]
+
+
+def test_term_rolls_over_from_december_into_january():
+    parsed = parse_schedule_dates(["Monday, 12/15", "Monday, 12/22", "Monday, 01/05"], reference_year=2025)
+
+    assert parsed.tolist() == dates("2025-12-15", "2025-12-22", "2026-01-05")
+
+
+def test_rollover_is_decided_per_group():
+    values = ["Monday, 12/15", "Monday, 01/05", "Monday, 09/08", "Monday, 12/15"]
+
+    grouped = parse_schedule_dates(values, reference_year=2025, groups=["1A", "1A", "2A", "2A"])
+
+    # the second section starts its own year instead of inheriting the first one's rollover
+    assert grouped.tolist() == dates("2025-12-15", "2026-01-05", "2025-09-08", "2025-12-15")
+
+
+def test_tied_weekday_vote_keeps_the_reference_year():
+    # Monday 09/08 fits 2025, Sunday 09/08 fits 2024: one vote each
+    assert parse_schedule_dates(["Monday, 09/08", "Sunday, 09/08"], reference_year=2025).tolist() == dates(
+        "2025-09-08", "2025-09-08"
+    )
+    # no candidate year matches at all
+    assert parse_schedule_dates(["Friday, 09/08"], reference_year=2025).tolist() == dates("2025-09-08")
+
+
+def test_february_29th_picks_the_leap_year():
+    assert parse_schedule_dates(["Thursday, 02/29"], reference_year=2025).tolist() == dates("2024-02-29")
+    assert parse_schedule_dates(["Thursday, 02/29"], reference_year=2024).tolist() == dates("2024-02-29")
+
+
+def test_missing_and_garbage_values_are_nat():
+    values = [None, np.nan, "", "TBD", "09/08", "Monday, 13/01", "Monday, 02/30", "Monday, 09/08 SKIPPED FOR HOLIDAY!"]
+
+    parsed = parse_schedule_dates(pd.Series(values, index=range(10, 18)), reference_year=2025)
+
+    assert list(parsed.index) == list(range(10, 18))
+    assert parsed.tolist() == dates(None, None, None, None, None, None, None, "2025-09-08")
+
+
+def test_milestone_due_dates_match_per_section_on_a_combined_frame():
+    def section(name, wave, days):
+        return pd.DataFrame({
+            "section": name,
+            "track": "DA",
+            "wave_section": wave,
+            "date": days,
+            "assignment_due_after": [f"Milestone {i + 1}" for i in range(len(days))],
+        })
+
+    first = section("DA Section 1A", "1A", ["Monday, 12/15", "Monday, 01/05"])
+    second = section("DA Section 2A", "2A", ["Monday, 09/08", "Monday, 09/15"])
+    overrides = DueDateOverrides()
+
+    combined = milestone_due_dates(pd.concat([first, second], ignore_index=True), overrides)
+
+    expected = milestone_due_dates(first, overrides).tolist() + milestone_due_dates(second, overrides).tolist()
+    assert combined.tolist() == expected
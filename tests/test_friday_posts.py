@@ -0,0 +1,45 @@
+from dataclasses import astuple
+
+import pandas as pd
+import pytest
+
+from functions import get_fridays_between, plan_announcements, plan_week_across_sections
+from tests import legacy
+from utils.snapshot import compact_schedule
+
+
+def comparable(post):
+    # NaN never equals itself; every missing value reads the same in a post
+    return tuple(None if not isinstance(v, bool) and pd.isna(v) else v for v in astuple(post))
+
+
+@pytest.fixture(scope="module")
+def sections():
+    return legacy.shipped_sections()
+
+
+def test_friday_posts_match_the_row_by_row_path(sections):
+    checked = 0
+    for name, df in sections.items():
+        plan = plan_announcements(df)
+        fridays = [post.friday for post in plan.friday_posts]
+        assert fridays == get_fridays_between(df["date"].min(), df["date"].max() + pd.Timedelta(days=7)), name
+
+        for post in plan.friday_posts:
+            expected = legacy.friday_post(df, plan.track, plan.section, post.friday)
+            assert comparable(post) == comparable(expected), (name, post.friday)
+            checked += 1
+    assert checked > 100
+
+
+def test_week_across_sections_matches_each_section(sections):
+    combined = compact_schedule(pd.concat(sections.values(), ignore_index=True))
+    start, end = combined["date"].min(), combined["date"].max() + pd.Timedelta(days=7)
+
+    for friday in get_fridays_between(start, end)[::3]:
+        posts = plan_week_across_sections(combined, friday)
+
+        assert list(posts) == list(sections)
+        for name, df in sections.items():
+            expected = legacy.friday_post(df, df["track"].iloc[0], df["wave_section"].iloc[0], friday)
+            assert comparable(posts[name]) == comparable(expected), (name, friday)
@@ -0,0 +1,19 @@
+from benchmarks.import_time import DEFAULT_BUDGET_MS, budget_failures, measure_median
+
+
+def test_app_imports_stay_within_budget():
+    total_ms, _, modules = measure_median()
+
+    assert budget_failures(total_ms, modules) == [], f"{total_ms:.0f} ms of a {DEFAULT_BUDGET_MS} ms budget"
+
+
+def test_budget_check_flags_slow_or_eager_imports():
+    modules = {"pandas": (1, 1), "gspread.client": (1, 1)}
+
+    failures = budget_failures(DEFAULT_BUDGET_MS + 1, modules)
+
+    assert failures == [
+        "Google client modules imported at startup: gspread.client",
+        f"{DEFAULT_BUDGET_MS + 1} ms is over the {DEFAULT_BUDGET_MS} ms budget",
+    ]
+    assert budget_failures(DEFAULT_BUDGET_MS, {"pandas": (1, 1)}) == []
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from utils.overrides import DueDateOverrides
+
+DUE = datetime(2025, 10, 5)
+
+
+@pytest.fixture
+def overrides():
+    return DueDateOverrides([
+        ("DA Section 1A", "Milestone 1", DUE, "exact"),
+        ("DA Section 1B", "portfolio project", datetime(2025, 11, 2), "prefix"),
+    ])
+
+
+def test_lookup_many_matches_lookup_with_missing_values(overrides):
+    sections = [None, "DA Section 1A", np.nan, "da  section 1a", "DA Section 1B", None]
+    titles = ["Milestone 1", "Milestone 1", "Milestone 1", None, "Portfolio Project: Grammys", "Portfolio Project: Grammys"]
+
+    batch = overrides.lookup_many(sections, titles)
+
+    expected = [overrides.lookup(section, title) for section, title in zip(sections, titles)]
+    assert expected == [None, DUE, None, None, datetime(2025, 11, 2), None]
+    assert [None if np.isnat(due) else due.astype("datetime64[s]").item() for due in batch] == expected
@@ -0,0 +1,54 @@
+import csv
+import os
+
+from utils.artifacts import render_section
+from utils.sheets import values_to_frame
+
+CSV_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "csv_data")
+
+
+def section_values(name):
+    with open(os.path.join(CSV_DIR, f"{name}.csv"), newline="", encoding="utf-8") as fh:
+        return list(csv.reader(fh))
+
+
+def test_section_without_parseable_dates_still_renders():
+    values = section_values("DA Section 1A")
+    date_col = values[0].index("date")
+    for row in values[1:]:
+        row[date_col] = "TBD"
+    df = values_to_frame(values, "DA Section 1A")
+    assert df["date"].isna().all()
+
+    rendered = render_section("DA Section 1A", df)
+
+    assert not rendered["has_dates"]
+    assert rendered["fridays"] == []
+    assert rendered["reminders"]
+    first = rendered["reminders"][0]
+    assert first["label"].endswith("on *None*")
+    assert "Unknown Date" in first["body"]
+
+
+def test_announcements_panel_falls_back_without_dates():
+    from streamlit.testing.v1 import AppTest
+
+    def panel(csv_path):
+        # runs as its own script under AppTest, so it imports what it needs
+        import csv
+
+        from utils.artifacts import paint_announcements, render_section
+        from utils.sheets import values_to_frame
+
+        with open(csv_path, newline="", encoding="utf-8") as fh:
+            values = list(csv.reader(fh))
+        date_col = values[0].index("date")
+        for row in values[1:]:
+            row[date_col] = "TBD"
+        paint_announcements(render_section("DA Section 1A", values_to_frame(values, "DA Section 1A")))
+
+    at = AppTest.from_function(panel, args=(os.path.join(CSV_DIR, "DA Section 1A.csv"),)).run()
+
+    assert not at.exception
+    assert [w.value for w in at.warning] == ["⚠️ No dates found in the schedule."]
+    assert len(at.expander) == 1
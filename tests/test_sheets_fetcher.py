@@ -0,0 +1,160 @@
+import threading
+
+import pytest
+
+from utils.fake_sheets import FakeAPIError, FakeClient, FakeSpreadsheet, FakeWorksheet
+from utils.sheets import SheetsConnection, SheetsFetcher, TokenBucket, forget_sheet_ranges
+
+HEADER = ["LL_num", "date", "livelab_title", "videos_watch_by", "assignment_due_after", "notes"]
+ROWS = [
+    ["LL1", "Monday, 09/08", "Welcome + Orientation", "Intro", "", ""],
+    ["LL2", "Monday, 09/15", "Spreadsheets", "Formulas", "Milestone 1", ""],
+]
+
+
+class FakeClock:
+    """time.monotonic / time.sleep pair where sleeping just advances the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def spreadsheet():
+    ss = FakeSpreadsheet([FakeWorksheet("DA Section 1A", [HEADER] + ROWS)])
+    forget_sheet_ranges(ss)  # the layout cache is process-wide
+    yield ss
+    forget_sheet_ranges(ss)
+
+
+def make_fetcher(spreadsheet, **options):
+    options.setdefault("sleep", lambda seconds: None)
+    return SheetsFetcher(SheetsConnection(client=FakeClient([spreadsheet])), **options)
+
+
+def test_concurrent_fetches_share_one_call(spreadsheet):
+    spreadsheet.latency = 0.2  # long enough for every caller to join the first fetch
+    fetcher = make_fetcher(spreadsheet)
+    start = threading.Barrier(8)
+    results = []
+
+    def load():
+        start.wait()
+        results.append(fetcher.fetch_all_sections())
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert spreadsheet.calls["values_batch_get"] == 1
+    assert spreadsheet.calls["fetch_sheet_metadata"] == 1
+    assert fetcher.stats()["calls"] == 1
+    assert fetcher.stats()["saved"] == 7
+    assert all(result is results[0] for result in results)
+    assert list(results[0]["DA Section 1A"]["livelab_title"]) == ["Welcome + Orientation", "Spreadsheets"]
+
+
+def test_rate_limited_calls_are_retried_with_backoff(spreadsheet):
+    sleeps = []
+    fetcher = make_fetcher(spreadsheet, sleep=sleeps.append, backoff=1.0, max_backoff=32.0)
+    spreadsheet.fail_next(429, 429)
+
+    frames = fetcher.fetch_all_sections()
+
+    assert list(frames) == ["DA Section 1A"]
+    assert spreadsheet.calls["errors"] == 2
+    stats = fetcher.stats()
+    assert stats["rate_limited"] == 2
+    assert stats["retries"] == 2
+    assert stats["calls"] == 3
+    # full jitter: attempt n waits somewhere in [0, backoff * 2**n]
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0
+    assert 0 <= sleeps[1] <= 2.0
+
+
+def test_gives_up_after_max_retries(spreadsheet):
+    fetcher = make_fetcher(spreadsheet, max_retries=2)
+    spreadsheet.fail_next(429, 429, 429, 429)
+
+    with pytest.raises(FakeAPIError) as excinfo:
+        fetcher.fetch_all_sections()
+
+    assert excinfo.value.code == 429
+    stats = fetcher.stats()
+    assert stats["calls"] == 3  # first try + max_retries
+    assert stats["retries"] == 2
+    assert spreadsheet.calls["values_batch_get"] == 0
+
+
+def test_other_errors_are_not_retried(spreadsheet):
+    fetcher = make_fetcher(spreadsheet)
+    spreadsheet.fail_next(500)
+
+    with pytest.raises(FakeAPIError):
+        fetcher.fetch_all_sections()
+
+    assert fetcher.stats()["calls"] == 1
+    assert "retries" not in fetcher.stats()
+
+
+def test_token_bucket_throttles_past_the_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.acquire(2) == pytest.approx(1.0)
+    assert clock.now == pytest.approx(1.5)
+
+    clock.now += 10  # idle time refills only up to capacity
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test_fetcher_takes_one_token_per_api_request(spreadsheet):
+    clock = FakeClock()
+    fetcher = make_fetcher(spreadsheet, sleep=clock.sleep)
+    fetcher.bucket = TokenBucket(1, 2, clock=clock, sleep=clock.sleep)
+
+    fetcher.fetch_all_sections()  # metadata + values: uses the whole burst
+    assert clock.now == 0
+    fetcher.fetch_all_sections()  # cached layout: values only
+    fetcher.fetch_all_sections()
+
+    assert clock.now == pytest.approx(2.0)
+    assert fetcher.stats()["quota_wait_ms"] == 2000
+    assert fetcher.stats()["requests"] == sum(spreadsheet.calls.values()) == 4
+
+
+def test_layout_refetch_is_charged(spreadsheet):
+    fetcher = make_fetcher(spreadsheet)
+    fetcher.fetch_all_sections()
+    spreadsheet._worksheets[0]._values[0].append("new_column")  # header grows into the spare column
+    fetcher.fetch_all_sections()
+    fetcher.fetch_all_sections()
+
+    # 2 + (values, metadata, values) + values
+    assert sum(spreadsheet.calls.values()) == 6
+    assert fetcher.stats()["requests"] == 6
+
+
+def test_non_schedule_worksheet_is_skipped(spreadsheet):
+    spreadsheet._worksheets.append(FakeWorksheet("Notes", [["todo"], ["check LL3"]]))
+    spreadsheet._worksheets[-1]._calls = spreadsheet.calls
+    fetcher = make_fetcher(spreadsheet)
+
+    frames = fetcher.fetch_all_sections()
+
+    assert list(frames) == ["DA Section 1A"]
+    assert len(frames["DA Section 1A"]) == 2
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from functions import build_watch_guides, build_watch_markdown, split_schedule_parts
+from tests import legacy
+from utils.snapshot import compact_schedule
+
+
+@pytest.fixture(scope="module")
+def sections():
+    return legacy.shipped_sections()
+
+
+def expected_guides(df, max_parts):
+    parts = legacy.split_parts(df, max_parts=max_parts)
+    return {k: legacy.watch_markdown(part, k) for k, part in enumerate(parts, start=1) if not part.empty}
+
+
+@pytest.mark.parametrize("max_parts", [2, None])
+def test_watch_guides_match_the_row_by_row_path(sections, max_parts):
+    combined = compact_schedule(pd.concat(sections.values(), ignore_index=True))
+
+    guides = build_watch_guides(combined, max_parts=max_parts)
+
+    assert list(guides) == list(sections)
+    for name, df in sections.items():
+        expected = expected_guides(df, max_parts or len(df))
+        assert guides[name] == expected, name
+        per_section = {k: build_watch_markdown(part, k) for k, part in split_schedule_parts(df, max_parts).items()}
+        assert per_section == expected, name
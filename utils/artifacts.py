@@ -0,0 +1,267 @@
+# =========================================================
+# 🗃️ Pre-rendered Announcement Artifacts
+# =========================================================
+# render_section() turns one section's schedule into JSON-ready text:
+# watch-by guides, Friday posts and end-of-LiveLab reminders, exactly as
+# the app paints them. Artifacts are those renders saved under
+#
+#   artifacts/v<ARTIFACT_VERSION>/<section>/<key>.json
+#
+# where key hashes the source CSV, the due-date overrides, utils/edits.py,
+# the rendering code (functions.py, this file) and the artifact version,
+# so editing any of them simply stops old artifacts matching (stale
+# artifacts are never served). Bump ARTIFACT_VERSION when the artifact
+# format itself changes.
+#
+# Build them ahead of time with:  python generate_announcements.py --artifacts
+# =========================================================
+import glob
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from functions import (
+    build_watch_markdown,
+    friday_post_blocks,
+    friday_post_error,
+    friday_post_label,
+    friday_post_markdown,
+    plan_announcements,
+    reminder_body,
+    reminder_label,
+    reminder_markdown,
+    render_post_blocks,
+    render_reminder_text,
+    schedule_hash,
+    split_schedule_parts,
+    strip_streamlit_colors,
+)
+from utils.overrides import DEFAULT_PATH as OVERRIDES_PATH
+from utils.timing import timed
+
+ARTIFACT_DIR = "artifacts"
+ARTIFACT_VERSION = 2
+# everything besides the CSV that shapes a render: overrides data, the
+# MUST EDIT due days and the rendering code itself
+RENDER_INPUTS = (
+    OVERRIDES_PATH,
+    os.path.join(os.path.dirname(__file__), "edits.py"),
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "functions.py"),
+    os.path.abspath(__file__),
+)
+
+_WATCH_GUIDE_LABEL = ":blue[**📆 SkillBuilder Watch By Schedule**]"
+
+
+# =========================================================
+# 🔧 JSON helpers
+# =========================================================
+def to_jsonable(value):
+    """Recursively convert Timestamps, numpy scalars, NaN/NaT and tuples into plain JSON types."""
+    if isinstance(value, dict):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, datetime):  # includes pd.Timestamp
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+# =========================================================
+# 🧾 Render one section
+# =========================================================
+def _interleave(guides, fridays, friday_of):
+    """
+    Yield (guide, None) / (None, friday) in display order: Part 1's guide
+    first, each later guide just before the first Friday on or after its
+    start, and any guide left over (no start date, or after the last
+    Friday) at the end.
+    """
+    yield guides[0], None
+    pending = list(guides[1:])
+    for item in fridays:
+        while pending and pending[0]["starts"] is not None and friday_of(item) >= pending[0]["starts"]:
+            yield pending.pop(0), None
+        yield None, item
+    for guide in pending:
+        yield guide, None
+
+
+@timed("render")
+def render_section(name, df):
+    """
+    Everything the 📣 HQ Announcement Templates and 📝 End-of-LiveLab tabs show
+    for one section, as a JSON-ready dict (dates as ISO strings). Also carries
+    a combined plain-Markdown document for bots and exports.
+    """
+    plan = plan_announcements(df)
+    has_dates = bool(df["date"].notna().any())
+
+    # one watch-by guide per part; Part 2+ guides are shown from their first LiveLab date on
+    parts = split_schedule_parts(df)
+    guides = [{"part": 1, "starts": None, "markdown": build_watch_markdown(parts.get(1, df.iloc[:0]), 1)}]
+    if has_dates:
+        guides += [
+            {"part": k, "starts": frame["date"].min(), "markdown": build_watch_markdown(frame, k)}
+            for k, frame in sorted(parts.items())
+            if k > 1
+        ]
+
+    fridays = [
+        {
+            "friday": post.friday,
+            "label": friday_post_label(post),
+            "error": friday_post_error(post),
+            "blocks": friday_post_blocks(post) if post.has_past else [],
+            "markdown": friday_post_markdown(post),
+            "post": asdict(post),
+        }
+        for post in plan.friday_posts
+    ]
+    reminders = [
+        {
+            "label": reminder_label(rem),
+            "body": reminder_body(rem),
+            "markdown": reminder_markdown(rem),
+            "reminder": asdict(rem),
+        }
+        for rem in plan.reminders
+    ]
+
+    # Markdown in the same order as the app: each later part's guide lands on its first Friday
+    lines = [f"# 📣 {name} — HQ Announcement Templates"]
+    for guide, posts in _interleave(guides, fridays, lambda item: item["friday"]):
+        lines += ["## 📆 SkillBuilder Watch By Schedule", guide["markdown"]] if guide else [posts["markdown"]]
+    lines.append(f"# 📝 {name} — End of LiveLab Reminders")
+    lines += [item["markdown"] for item in reminders] or ["No LiveLabs found to build end-of-lab reminders."]
+
+    return to_jsonable({
+        "section": name,
+        "track": plan.track,
+        "wave_section": plan.section,
+        "data_hash": schedule_hash(df),
+        "has_dates": has_dates,
+        "watch_guides": guides,
+        "fridays": fridays,
+        "reminders": reminders,
+        "markdown": strip_streamlit_colors("\n\n".join(lines)) + "\n",
+    })
+
+
+# =========================================================
+# 🔑 Keys, load & save
+# =========================================================
+@lru_cache(maxsize=32)
+def _file_digest(path, mtime_ns):
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+def _inputs_digest():
+    """One hash over every file a render depends on besides the section CSV (missing files hash as "")."""
+    digests = []
+    for path in RENDER_INPUTS:
+        try:
+            digests.append(_file_digest(path, os.stat(path).st_mtime_ns))
+        except OSError:
+            digests.append("")
+    return "|".join(digests)
+
+
+def render_inputs_mtime():
+    """Latest mtime (epoch seconds) of RENDER_INPUTS, e.g. for Last-Modified headers."""
+    mtimes = [0]
+    for path in RENDER_INPUTS:
+        try:
+            mtimes.append(os.stat(path).st_mtime)
+        except OSError:
+            pass
+    return max(mtimes)
+
+
+def artifact_key(source_sha256):
+    """Cache key for a section render: source CSV hash + RENDER_INPUTS hashes + artifact version."""
+    raw = f"v{ARTIFACT_VERSION}|{source_sha256}|{_inputs_digest()}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def artifact_path(name, key, root=ARTIFACT_DIR):
+    return os.path.join(root, f"v{ARTIFACT_VERSION}", name, f"{key}.json")
+
+
+def load_artifact(name, key, root=ARTIFACT_DIR):
+    """The stored render for (section, key), or None on a miss."""
+    try:
+        with open(artifact_path(name, key, root), encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def save_artifact(name, key, rendered, root=ARTIFACT_DIR):
+    """Write a render and drop older artifacts for the same section. Best effort."""
+    path = artifact_path(name, key, root)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as fh:
+            json.dump(rendered, fh, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+        for old in glob.glob(os.path.join(glob.escape(os.path.dirname(path)), "*.json")):
+            if old != path:
+                os.remove(old)
+    except OSError:
+        # read-only deploys just keep computing live
+        return None
+    return path
+
+
+# =========================================================
+# 🎨 Paint a render in Streamlit
+# =========================================================
+def paint_announcements(rendered):
+    """Draw the HQ Announcement Templates tab from a render (fresh or loaded)."""
+    import streamlit as st
+
+    guides = rendered["watch_guides"]
+
+    if not rendered["has_dates"]:
+        # Part 1 only, then the warning
+        with st.expander(_WATCH_GUIDE_LABEL, expanded=False):
+            st.markdown(guides[0]["markdown"])
+        st.warning("⚠️ No dates found in the schedule.")
+        return
+
+    # Part 1 up top, Friday posts, and each later part's guide at the correct time
+    for guide, item in _interleave(guides, rendered["fridays"], lambda item: item["friday"]):
+        if guide is not None:
+            with st.expander(_WATCH_GUIDE_LABEL, expanded=False):
+                st.markdown(guide["markdown"])
+        elif item["error"]:
+            st.error(item["error"])
+        else:
+            render_post_blocks(item["label"], item["blocks"])
+
+
+def paint_reminders(rendered):
+    """Draw the End of LiveLab Reminders tab from a render (fresh or loaded)."""
+    import streamlit as st
+
+    if not rendered["reminders"]:
+        st.info("No LiveLabs found to build end-of-lab reminders.")
+        return
+    for item in rendered["reminders"]:
+        render_reminder_text(item["label"], item["body"])
@@ -1,4 +1,4 @@
-from datetime import datetime
+from utils.overrides import load_overrides
 
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -23,31 +23,8 @@ def get_milestone_due_days(section_name):
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # 📆 MUST EDIT: Custom Project Due Dates
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
-PROJECT_DUE_DATES = {
-    ("DA Section 1A", "portfolio project: analyzing website data with the grammys"): datetime(2025, 10, 5),
-    ("DA Section 1B", "portfolio project: analyzing website data with the grammys"): datetime(2025, 10, 5),
-    ("DA Section 2A", "portfolio project: analyzing website data with the grammys"): datetime(2025, 10, 5),
-    ("DA Section 2B", "portfolio project: analyzing website data with the grammys"): datetime(2025, 10, 5),
-    ("DA Section 2C", "portfolio project: analyzing website data with the grammys"): datetime(2025, 10, 5),
-    ("DC Section 1A", "portfolio project: an intel data center"): datetime(2025, 10, 5),
-    ("DC Section 1B", "portfolio project: an intel data center"): datetime(2025, 10, 5),
-    ("DC Section 2A", "portfolio project: an intel data center"): datetime(2025, 10, 5),
-    ("DC Section 2B", "portfolio project: an intel data center"): datetime(2025, 10, 5),
-    ("DC Section 2C", "portfolio project: an intel data center"): datetime(2025, 10, 5),
-    ("DM Section 1A", "portfolio project"): datetime(2025, 10, 5),
-    ("DM Section 1B", "portfolio project"): datetime(2025, 10, 5),
-    ("DM Section 2A", "portfolio project"): datetime(2025, 10, 5),
-    ("DM Section 2B", "portfolio project"): datetime(2025, 10, 5),
-    ("DM Section 2C", "portfolio project"): datetime(2025, 10, 5),
-    ("DA Section 1A", "portfolio project: build a data center with intel"): datetime(2025, 11, 30),
-    ("DA Section 1B", "portfolio project: build a data center with intel"): datetime(2025, 11, 30),
-    ("DA Section 2A", "portfolio project: build a data center with intel"): datetime(2025, 11, 16),
-    ("DA Section 2B", "portfolio project: build a data center with intel"): datetime(2025, 11, 16),
-    ("DA Section 2C", "portfolio project: build a data center with intel"): datetime(2025, 11, 16),
-    ("DC Section 1A", "portfolio project: analyzing website performance for the grammys"): datetime(2025, 11, 30),
-    ("DC Section 1B", "portfolio project: analyzing website performance for the grammys"): datetime(2025, 11, 30),
-    ("DC Section 2A", "portfolio project: analyzing website performance for the grammys"): datetime(2025, 11, 16),
-    ("DC Section 2B", "portfolio project: analyzing website performance for the grammys"): datetime(2025, 11, 16),
-    ("DC Section 2C", "portfolio project: analyzing website performance for the grammys"): datetime(2025, 11, 16),
-
-}
\ No newline at end of file
+# Edit utils/project_due_dates.csv — one row per (section, milestone title):
+#   section,title,due_date,match
+#   DA Section 1A,portfolio project: analyzing website data with the grammys,2025-10-05,exact
+# Use match=prefix for a title that should cover every milestone starting with it.
+PROJECT_DUE_DATES = load_overrides()
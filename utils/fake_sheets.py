@@ -0,0 +1,228 @@
+# =========================================================
+# 🧪 Local Fake gspread Client
+# =========================================================
+# Just enough of gspread's Client / Spreadsheet / Worksheet surface to run
+# the Sheets loaders offline, backed by the CSVs in csv_data/. Mirrors the
+# API's habit of dropping trailing empty rows and cells.
+#
+#   client = FakeClient.from_csv_dir("csv_data")
+#   spreadsheet = client.open("Curriculum Schedules All Tracks")
+#
+# Every API call can be slowed down and made to fail, to exercise the
+# single-flight / quota / backoff layer in utils/sheets.py:
+#
+#   FakeClient.from_csv_dir(latency=0.3, error_rate=0.1)   # random 429s
+#   spreadsheet.fail_next(429, 429)                         # next two calls
+# =========================================================
+import csv
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+
+try:
+    from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound
+except ImportError:  # gspread is optional offline
+    SpreadsheetNotFound = WorksheetNotFound = KeyError
+
+from utils.sheets import SPREADSHEET_NAME
+
+_A1 = re.compile(r"^([A-Z]+)?(\d+)?(?::([A-Z]+)?(\d+)?)?$")
+
+
+class FakeAPIError(Exception):
+    """Same .code / .error shape as gspread.exceptions.APIError, without an HTTP response."""
+
+    _STATUS = {429: "RESOURCE_EXHAUSTED", 500: "INTERNAL", 503: "UNAVAILABLE"}
+
+    def __init__(self, code, message=None):
+        self.code = code
+        self.error = {"code": code, "message": message or f"fake error {code}", "status": self._STATUS.get(code, "UNKNOWN")}
+        super().__init__(self.error)
+
+    def __str__(self):
+        return f"APIError: [{self.code}]: {self.error['message']}"
+
+
+def _col_number(letters):
+    n = 0
+    for ch in letters:
+        n = n * 26 + (ord(ch) - ord("A") + 1)
+    return n
+
+
+def split_range(range_name):
+    """"'DA Section 1A'!A1:I25" -> ('DA Section 1A', 'A1:I25'); bare A1 ranges get sheet None."""
+    if range_name.startswith("'"):
+        end = range_name.index("'", 1)
+        while range_name[end + 1:end + 2] == "'":  # '' is an escaped quote
+            end = range_name.index("'", end + 2)
+        sheet = range_name[1:end].replace("''", "'")
+        rest = range_name[end + 1:]
+        return sheet, rest[1:] if rest.startswith("!") else None
+    if "!" in range_name:
+        sheet, cells = range_name.split("!", 1)
+        return sheet, cells
+    if _A1.match(range_name):
+        return None, range_name
+    return range_name, None
+
+
+def _trim(rows):
+    """Drop trailing empty cells and rows, like the Sheets values API."""
+    out = []
+    for row in rows:
+        row = list(row)
+        while row and row[-1] == "":
+            row.pop()
+        out.append(row)
+    while out and not out[-1]:
+        out.pop()
+    return out
+
+
+class FakeWorksheet:
+    def __init__(self, title, values, row_count=1000, col_count=26):
+        self.title = title
+        self._values = [list(r) for r in values]
+        self.row_count = max(row_count, len(self._values))
+        self.col_count = max([col_count] + [len(r) for r in self._values])
+        self._calls = Counter()  # shared with the parent FakeSpreadsheet
+
+    def _range_values(self, cells=None):
+        rows = self._values
+        if cells:
+            m = _A1.match(cells)
+            if not m:
+                raise ValueError(f"Unsupported range: {cells}")
+            col1, row1, col2, row2 = m.groups()
+            r1 = int(row1) if row1 else 1
+            c1 = _col_number(col1) if col1 else 1
+            if ":" in cells:
+                r2 = int(row2) if row2 else self.row_count
+                c2 = _col_number(col2) if col2 else self.col_count
+            else:
+                r2, c2 = r1, c1
+            rows = [row[c1 - 1:c2] for row in rows[r1 - 1:r2]]
+        return _trim(rows)
+
+    def _api_call(self, name):
+        # the parent FakeSpreadsheet swaps in its own hook (latency / errors)
+        self._calls[name] += 1
+
+    def get_all_values(self, range_name=None, **kwargs):
+        self._api_call("values_get")
+        rows = self._range_values(range_name)
+        width = max((len(r) for r in rows), default=0)
+        return [r + [""] * (width - len(r)) for r in rows]
+
+
+class FakeSpreadsheet:
+    """
+    latency: seconds each API call takes (a number, or a (low, high) range).
+    error_rate: chance that a call fails with `error_code` (429 by default).
+    """
+
+    def __init__(self, worksheets, title=SPREADSHEET_NAME, latency=0.0, error_rate=0.0, error_code=429, seed=0):
+        self.title = title
+        self.id = "fake-" + re.sub(r"\W+", "-", title.lower())
+        self.calls = Counter()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._failures = []
+        self._worksheets = list(worksheets)
+        for ws in self._worksheets:
+            ws._calls = self.calls
+            ws._api_call = self._api_call
+
+    def fail_next(self, *errors):
+        """Make the next API calls raise these, in order (HTTP codes or exception instances)."""
+        with self._lock:
+            self._failures.extend(errors)
+
+    def _api_call(self, name):
+        """Count the call, wait out the simulated latency, maybe fail."""
+        with self._lock:
+            self.calls[name] += 1
+            delay = self._rng.uniform(*self.latency) if isinstance(self.latency, tuple) else self.latency
+            error = self._failures.pop(0) if self._failures else None
+            if error is None and self.error_rate and self._rng.random() < self.error_rate:
+                error = self.error_code
+            if error is not None:
+                self.calls["errors"] += 1
+        if delay:
+            time.sleep(delay)
+        if error is not None:
+            raise FakeAPIError(error) if isinstance(error, int) else error
+
+    @classmethod
+    def from_csv_dir(cls, csv_dir="csv_data", title=SPREADSHEET_NAME, **options):
+        worksheets = []
+        for fname in sorted(os.listdir(csv_dir)):
+            if not fname.endswith(".csv"):
+                continue
+            with open(os.path.join(csv_dir, fname), newline="", encoding="utf-8") as fh:
+                worksheets.append(FakeWorksheet(fname[:-len(".csv")], list(csv.reader(fh))))
+        return cls(worksheets, title=title, **options)
+
+    def fetch_sheet_metadata(self, params=None):
+        self._api_call("fetch_sheet_metadata")
+        return {
+            "spreadsheetId": self.id,
+            "properties": {"title": self.title},
+            "sheets": [
+                {"properties": {
+                    "sheetId": i,
+                    "title": ws.title,
+                    "index": i,
+                    "gridProperties": {"rowCount": ws.row_count, "columnCount": ws.col_count},
+                }}
+                for i, ws in enumerate(self._worksheets)
+            ],
+        }
+
+    def worksheets(self, exclude_hidden=False):
+        self._api_call("fetch_sheet_metadata")
+        return list(self._worksheets)
+
+    def worksheet(self, title):
+        self._api_call("fetch_sheet_metadata")
+        for ws in self._worksheets:
+            if ws.title == title:
+                return ws
+        raise WorksheetNotFound(title)
+
+    def values_batch_get(self, ranges, params=None):
+        self._api_call("values_batch_get")
+        by_title = {ws.title: ws for ws in self._worksheets}
+        value_ranges = []
+        for range_name in ranges:
+            sheet, cells = split_range(range_name)
+            if sheet not in by_title:
+                raise WorksheetNotFound(sheet)
+            value_ranges.append({
+                "range": range_name,
+                "majorDimension": "ROWS",
+                "values": by_title[sheet]._range_values(cells),
+            })
+        return {"spreadsheetId": self.id, "valueRanges": value_ranges}
+
+
+class FakeClient:
+    def __init__(self, spreadsheets):
+        self._spreadsheets = {s.title: s for s in spreadsheets}
+
+    @classmethod
+    def from_csv_dir(cls, csv_dir="csv_data", title=SPREADSHEET_NAME, **options):
+        """options (latency, error_rate, error_code, seed) go to FakeSpreadsheet."""
+        return cls([FakeSpreadsheet.from_csv_dir(csv_dir, title=title, **options)])
+
+    def open(self, title):
+        if title not in self._spreadsheets:
+            raise SpreadsheetNotFound(title)
+        return self._spreadsheets[title]
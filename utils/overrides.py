@@ -0,0 +1,165 @@
+# =========================================================
+# 📆 Project Due Date Overrides
+# =========================================================
+# Registry behind PROJECT_DUE_DATES. Rows live in a CSV data file
+# (section, title, due_date, match) and are normalized once at load time,
+# so each lookup is a dict hit instead of a scan over every entry, and
+# lookup_many() resolves a whole column against prebuilt key indexes.
+#
+#   match = exact   -> title must equal the milestone title
+#   match = prefix  -> title only has to be the start of the milestone title
+#                      (e.g. "portfolio project" covers "Portfolio Project: ...")
+# =========================================================
+import csv
+import os
+from datetime import datetime
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "project_due_dates.csv")
+MATCH_MODES = ("exact", "prefix")
+
+
+def normalize_key(text) -> str:
+    """Case- and whitespace-insensitive form used for every key."""
+    return " ".join(str(text).split()).lower()
+
+
+class DueDateOverrides:
+    """Pre-normalized (section, milestone title) -> due date lookups."""
+
+    def __init__(self, rows=()):
+        self._exact = {}
+        # section -> {prefix length -> {prefix -> due}}; one dict hit per distinct length
+        self._prefixes = {}
+        for section, title, due, match in rows:
+            key_section, key_title = normalize_key(section), normalize_key(title)
+            if match == "prefix":
+                by_len = self._prefixes.setdefault(key_section, {})
+                by_len.setdefault(len(key_title), {})[key_title] = due
+            else:
+                self._exact[(key_section, key_title)] = due
+        # longest prefix wins
+        self._prefixes = {
+            sec: sorted(by_len.items(), reverse=True) for sec, by_len in self._prefixes.items()
+        }
+
+    @classmethod
+    def from_csv(cls, path=DEFAULT_PATH):
+        """Parse the data file; a malformed row raises ValueError naming the file and line."""
+        rows = []
+        with open(path, newline="", encoding="utf-8") as fh:
+            reader = csv.DictReader(fh)
+            for rec in reader:
+                if not (rec.get("section") or "").strip():
+                    continue
+                where = f"{os.path.basename(path)} line {reader.line_num}"
+                due_text = (rec.get("due_date") or "").strip()
+                try:
+                    due = datetime.strptime(due_text, "%Y-%m-%d")
+                except ValueError:
+                    raise ValueError(f"{where}: bad due_date {due_text!r} (expected YYYY-MM-DD)") from None
+                match = (rec.get("match") or "exact").strip().lower()
+                if match not in MATCH_MODES:
+                    raise ValueError(f"{where}: bad match {match!r} (expected one of {', '.join(MATCH_MODES)})")
+                rows.append((rec["section"], rec.get("title") or "", due, match))
+        return cls(rows)
+
+    def lookup(self, section_name, milestone_title):
+        """Due date override for e.g. ('DA Section 1A', 'Portfolio Project: ...'), else None."""
+        if not isinstance(milestone_title, str):
+            return None
+        key_section, key_title = normalize_key(section_name), normalize_key(milestone_title)
+
+        due = self._exact.get((key_section, key_title))
+        if due is not None:
+            return due
+        for length, prefixes in self._prefixes.get(key_section, ()):
+            due = prefixes.get(key_title[:length])
+            if due is not None:
+                return due
+        return None
+
+    def lookup_many(self, section_names, milestone_titles):
+        """
+        lookup() for whole columns at once: normalized "section|title" keys
+        are matched against an index of the exact entries, then against one
+        index per distinct prefix length (longest first) for rows still
+        missing. Returns a datetime64 array (NaT = no override) in input order.
+        """
+        sections = np.asarray(section_names, dtype=object)
+        titles = np.asarray(milestone_titles, dtype=object)
+        due = np.full(len(titles), np.datetime64("NaT"), dtype="datetime64[ns]")
+        # lookup() ignores non-string titles (NaN, numbers)
+        valid = np.fromiter((isinstance(t, str) for t in titles), dtype=bool, count=len(titles))
+        if not valid.any() or not len(self):
+            return due
+
+        # normalize each distinct value once
+        key_sections = _normalize_unique(sections[valid])
+        key_titles = _normalize_unique(titles[valid])
+        found = _take(*self._exact_index, key_sections + _SEP + key_titles)
+        for length, index, dues in self._prefix_indexes:
+            missing = np.isnat(found)
+            if not missing.any():
+                break
+            truncated = np.array([title[:length] for title in key_titles[missing]], dtype=object)
+            found[missing] = _take(index, dues, key_sections[missing] + _SEP + truncated)
+        due[valid] = found
+        return due
+
+    @cached_property
+    def _exact_index(self):
+        keys = [section + _SEP + title for section, title in self._exact]
+        return pd.Index(keys, dtype=object), _due_array(self._exact.values())
+
+    @cached_property
+    def _prefix_indexes(self):
+        by_length = {}
+        for section, by_len in self._prefixes.items():
+            for length, prefixes in by_len:
+                for prefix, due in prefixes.items():
+                    by_length.setdefault(length, []).append((section + _SEP + prefix, due))
+        return [
+            (length, pd.Index([key for key, _ in entries], dtype=object), _due_array(due for _, due in entries))
+            for length, entries in sorted(by_length.items(), reverse=True)
+        ]
+
+    def __len__(self):
+        return len(self._exact) + sum(
+            len(prefixes) for by_len in self._prefixes.values() for _, prefixes in by_len
+        )
+
+
+_SEP = "\x1f"  # joins section and title keys; never appears in either
+
+
+def _normalize_unique(values: np.ndarray) -> np.ndarray:
+    """normalize_key() for an array, computed once per distinct value (None/NaN included, like lookup())."""
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    return np.array([normalize_key(v) for v in uniques], dtype=object)[codes]
+
+
+def _due_array(dues) -> np.ndarray:
+    return np.array([np.datetime64(pd.Timestamp(d), "ns") for d in dues], dtype="datetime64[ns]")
+
+
+def _take(index: pd.Index, dues: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """dues[position of each key in index], NaT where the key is absent."""
+    if not len(index):
+        return np.full(len(keys), np.datetime64("NaT"), dtype="datetime64[ns]")
+    positions = index.get_indexer(keys)
+    return np.where(positions >= 0, dues[positions], np.datetime64("NaT"))
+
+
+def load_overrides(path=DEFAULT_PATH) -> DueDateOverrides:
+    """
+    Load the override registry, or an empty one if the data file is missing.
+    A malformed row is an error, not a silently empty registry.
+    """
+    try:
+        return DueDateOverrides.from_csv(path)
+    except FileNotFoundError:
+        return DueDateOverrides()
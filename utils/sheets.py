@@ -0,0 +1,584 @@
+# =========================================================
+# 📡 Google Sheets Loading
+# =========================================================
+# Pulls every section's range with a single spreadsheet-level
+# values:batchGet call instead of one worksheet request per section.
+# Ranges are sized from worksheet metadata (one field-masked call, cached
+# for an hour) and clamped to the header's columns, so longer programs need
+# no code change and the API only returns used cells.
+# Works with a real gspread Spreadsheet or the local fake in
+# utils/fake_sheets.py. API calls go through SheetsFetcher, which
+# coalesces identical in-flight requests and stays under the read quota.
+# =========================================================
+import logging
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+
+import pandas as pd
+
+from functions import MILESTONE_DUE_COLUMN, add_ordinal_suffix, milestone_due_dates, parse_schedule_dates
+from utils import timing
+
+SPREADSHEET_NAME = "Curriculum Schedules All Tracks"
+SCOPES = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+READS_PER_MINUTE = 60  # Sheets API default read quota per user
+LAYOUT_FIELDS = "sheets.properties(sheetId,title,gridProperties(rowCount,columnCount))"
+SCHEDULE_COLUMNS = ("LL_num", "date", "livelab_title")  # what the panels can't do without
+
+logger = logging.getLogger("instructor_hub.sheets")
+
+
+def absolute_range(sheet_name, cell_range):
+    """'DA Section 1A', 'A1:I25' -> "'DA Section 1A'!A1:I25" (quotes escaped like gspread)."""
+    return "'{}'!{}".format(sheet_name.replace("'", "''"), cell_range)
+
+
+def column_letter(n):
+    """1 -> 'A', 26 -> 'Z', 27 -> 'AA'."""
+    letters = ""
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _pad(values):
+    """
+    Square up rows the API trimmed (trailing empty cells are omitted), like
+    get_all_values(), clamped to the header: stray cells right of the last
+    named column aren't part of the schedule.
+    """
+    if not values:
+        return []
+    width = _header_width(values)
+    return [row[:width] + [""] * (width - len(row)) for row in values]
+
+
+def _header_width(values):
+    header = values[0] if values else []
+    return max((i + 1 for i, cell in enumerate(header) if str(cell).strip()), default=0)
+
+
+# -------------------------------
+# 📐 Used ranges from sheet metadata
+# -------------------------------
+LAYOUT_MAX_AGE = 3600  # seconds before the worksheet list / grid sizes are re-read
+
+_layouts_lock = threading.Lock()
+_layouts = OrderedDict()  # spreadsheet id -> _Layout
+_MAX_LAYOUTS = 16
+
+
+class _Layout:
+    """One spreadsheet's worksheet grids, plus the header widths learned from fetched values."""
+
+    def __init__(self, grids):
+        self.grids = grids  # title -> (rows, cols)
+        self.widths = {}  # title -> columns named in the header
+        self.fetched_at = time.time()
+
+    def ranges(self):
+        # one spare column past the header, so a newly added column shows up (see _layout_changed)
+        return {
+            title: f"A1:{column_letter(min(cols, self.widths[title] + 1) if title in self.widths else cols)}{rows}"
+            for title, (rows, cols) in self.grids.items()
+        }
+
+
+def sheet_ranges(spreadsheet, max_age=LAYOUT_MAX_AGE):
+    """
+    {title: A1 range} for every worksheet with a grid.
+
+    The cache is time-based: the first call (and the first after max_age
+    seconds or forget_sheet_ranges()) makes one metadata request that asks
+    only for titles and grid sizes; later calls reuse it without touching
+    the API. Layout changes seen in the fetched values invalidate it early
+    (see fetch_all_section_values). The values API drops
+    trailing empty rows, so asking for every grid row returns exactly the
+    used rows; columns are clamped to the header once it has been seen.
+    """
+    key = getattr(spreadsheet, "id", None)
+    with _layouts_lock:
+        layout = _layouts.get(key)
+        if layout is not None and time.time() - layout.fetched_at < max_age:
+            _layouts.move_to_end(key)
+            timing.count("sheets.layout_hit")
+            return layout.ranges()
+
+    metadata = spreadsheet.fetch_sheet_metadata(params={"fields": LAYOUT_FIELDS})
+    properties = [sheet["properties"] for sheet in metadata.get("sheets", [])]
+    grids = {}
+    for props in properties:
+        grid = props.get("gridProperties", {})
+        rows, cols = grid.get("rowCount", 0), grid.get("columnCount", 0)
+        if rows and cols:
+            grids[props["title"]] = (rows, cols)
+    layout = _Layout(grids)
+    with _layouts_lock:
+        _layouts[key] = layout
+        _layouts.move_to_end(key)
+        while len(_layouts) > _MAX_LAYOUTS:
+            _layouts.popitem(last=False)
+    timing.count("sheets.layout_miss")
+    return layout.ranges()
+
+
+def forget_sheet_ranges(spreadsheet):
+    """Drop the cached layout so the next sheet_ranges() re-reads the metadata."""
+    with _layouts_lock:
+        _layouts.pop(getattr(spreadsheet, "id", None), None)
+
+
+def _layout_changed(spreadsheet, ranges, values):
+    """
+    Record each worksheet's header width; True if the fetched values no
+    longer fit the cached layout (a block reaching its last requested row
+    or a header filling the spare column means the sheet grew).
+    """
+    with _layouts_lock:
+        layout = _layouts.get(getattr(spreadsheet, "id", None))
+    if layout is None:
+        return False
+    changed = False
+    for title, rows in values.items():
+        if title not in layout.grids:
+            continue
+        grid_rows, grid_cols = layout.grids[title]
+        width = _header_width(rows)
+        requested_cols = min(grid_cols, layout.widths[title] + 1) if title in layout.widths else grid_cols
+        if len(rows) >= grid_rows or (title in layout.widths and width >= requested_cols < grid_cols):
+            changed = True
+        layout.widths[title] = width
+    return changed
+
+
+def fetch_all_section_values(spreadsheet, sheet_names=None, cell_range=None):
+    """
+    Raw cell values for many worksheets in one values:batchGet round trip.
+
+    sheet_names defaults to every worksheet in the spreadsheet. Each range
+    comes from sheet_ranges() (cached worksheet metadata) unless `cell_range`
+    pins one explicitly. If the values show the cached layout is out of date
+    (a sheet grew, or a requested worksheet is gone) the metadata is re-read
+    and the batch fetched once more. Returns {sheet name: list of rows,
+    header first}, each row clamped to the header's columns.
+    """
+    if cell_range is not None:
+        if sheet_names is None:
+            sheet_names = [ws.title for ws in spreadsheet.worksheets()]
+        sheet_names = list(sheet_names)
+        return _batch_get(spreadsheet, sheet_names, [absolute_range(name, cell_range) for name in sheet_names])
+
+    for attempt in range(2):
+        ranges = sheet_ranges(spreadsheet)
+        # worksheets without a grid (e.g. chart sheets) have no values to fetch
+        names = list(ranges) if sheet_names is None else [name for name in sheet_names if name in ranges]
+        try:
+            values = _batch_get(spreadsheet, names, [absolute_range(name, ranges[name]) for name in names])
+        except Exception as exc:
+            # a renamed or deleted worksheet: the cached ranges no longer parse
+            if attempt or not _is_bad_range(exc):
+                raise
+            forget_sheet_ranges(spreadsheet)
+            continue
+        if not _layout_changed(spreadsheet, ranges, values) or attempt:
+            return values
+        forget_sheet_ranges(spreadsheet)
+
+
+def _batch_get(spreadsheet, sheet_names, requested):
+    if not sheet_names:
+        return {}
+    response = spreadsheet.values_batch_get(requested)
+    value_ranges = response.get("valueRanges", [])
+    # valueRanges come back in request order
+    return {
+        name: _pad(vr.get("values", []))
+        for name, vr in zip(sheet_names, value_ranges)
+    }
+
+
+def _is_bad_range(exc) -> bool:
+    """A range naming a worksheet that doesn't exist (any more)."""
+    if getattr(exc, "code", None) == 400:  # gspread APIError: "Unable to parse range"
+        return True
+    return type(exc).__name__ == "WorksheetNotFound"
+
+
+def values_to_frame(values, sheet_name):
+    """
+    Rows from the API -> schedule DataFrame with parsed dates (same shape as
+    fetch_sheet_data). Raises ValueError if the header lacks SCHEDULE_COLUMNS.
+    """
+    if not values:
+        return pd.DataFrame()
+    missing = [column for column in SCHEDULE_COLUMNS if column not in values[0]]
+    if missing:
+        raise ValueError(f"{sheet_name!r} is not a schedule (no {', '.join(missing)} column)")
+    df = pd.DataFrame(values[1:], columns=values[0])
+    df["section"] = sheet_name
+    df["date"] = parse_schedule_dates(df["date"])
+    df["date_display"] = df["date"].apply(lambda x: add_ordinal_suffix(x))
+    df[MILESTONE_DUE_COLUMN] = milestone_due_dates(df)
+    return df
+
+
+def fetch_all_sections(spreadsheet, sheet_names=None, cell_range=None):
+    """
+    {sheet name: DataFrame} for every section, from a single batch request.
+    Worksheets that aren't schedules (see values_to_frame) are logged and
+    left out, so one odd tab doesn't cost every other section its data.
+    """
+    values = fetch_all_section_values(spreadsheet, sheet_names, cell_range)
+    frames = {}
+    for name, rows in values.items():
+        try:
+            frames[name] = values_to_frame(rows, name)
+        except ValueError as exc:
+            logger.warning("Skipping worksheet: %s", exc)
+            timing.count("sheets.skipped_worksheets")
+    return frames
+
+
+# =========================================================
+# 🔐 Shared Connection
+# =========================================================
+def _should_reconnect(exc) -> bool:
+    """Auth / transport failures a fresh session can fix (not bad ranges, quota, ...)."""
+    if getattr(exc, "code", None) == 401:  # gspread APIError: token rejected
+        return True
+    return type(exc).__name__ in {"RefreshError", "TransportError", "ConnectionError", "ChunkedEncodingError"}
+
+
+class SheetsConnection:
+    """
+    One authorized gspread client and spreadsheet handle, meant to live for
+    the whole process (the app keeps it in st.cache_resource). Auth and
+    open() happen lazily on first use; the access token is refreshed only
+    once it has expired, and run() reconnects once on auth/transport errors.
+
+    Pass `client` (e.g. utils.fake_sheets.FakeClient) to skip Google auth.
+    """
+
+    def __init__(self, creds_info=None, spreadsheet_name=SPREADSHEET_NAME, client=None):
+        self._creds_info = dict(creds_info) if creds_info is not None else None
+        self._spreadsheet_name = spreadsheet_name
+        self._lock = threading.Lock()
+        self._static_client = client
+        self._creds = None
+        self._client = client
+        self._spreadsheet = None
+
+    def _connect(self):
+        if self._static_client is None:
+            import gspread
+            from google.oauth2.service_account import Credentials
+
+            self._creds = Credentials.from_service_account_info(self._creds_info, scopes=SCOPES)
+            self._client = gspread.authorize(self._creds)
+        self._spreadsheet = self._client.open(self._spreadsheet_name)
+
+    def _refresh_token_if_expired(self):
+        # tokens last ~1h; a long-lived process refreshes on demand, not per rerun
+        if self._creds is not None and (self._creds.token is None or self._creds.expired):
+            from google.auth.transport.requests import Request
+
+            self._creds.refresh(Request())
+
+    @property
+    def spreadsheet(self):
+        with self._lock:
+            if self._spreadsheet is None:
+                self._connect()
+            else:
+                self._refresh_token_if_expired()
+            return self._spreadsheet
+
+    def reconnect(self):
+        """Drop the current session and authorize again."""
+        with self._lock:
+            self._creds = None
+            self._client = self._static_client
+            self._spreadsheet = None
+            self._connect()
+
+    def run(self, fn):
+        """Call fn(spreadsheet), reconnecting and retrying once if the session went bad."""
+        try:
+            return fn(self.spreadsheet)
+        except Exception as exc:
+            if not _should_reconnect(exc):
+                raise
+            self.reconnect()
+            return fn(self.spreadsheet)
+
+
+# =========================================================
+# 🚦 Single-Flight + Read Quota
+# =========================================================
+class SingleFlight:
+    """
+    Per-key request coalescing: while a call for `key` is running, other
+    callers with the same key wait for it and share its result (or error)
+    instead of starting their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Run fn() once per key at a time -> (result, shared); shared is True for waiters."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class TokenBucket:
+    """Refills `rate` tokens per second up to `capacity`; acquire() blocks until one is free."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated = clock()
+
+    def acquire(self, tokens=1) -> float:
+        """Take `tokens`, sleeping as needed. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+def _is_rate_limited(exc) -> bool:
+    """HTTP 429 / RESOURCE_EXHAUSTED from the Sheets API (gspread APIError or the fake)."""
+    if getattr(exc, "code", None) == 429:
+        return True
+    return (getattr(exc, "error", None) or {}).get("status") == "RESOURCE_EXHAUSTED"
+
+
+def _retry_after(exc):
+    """Seconds from a Retry-After header, if the error carries one."""
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class _MeteredSpreadsheet:
+    """Spreadsheet stand-in that takes a quota token before each API request it forwards."""
+
+    _REQUESTS = frozenset({"fetch_sheet_metadata", "values_batch_get", "values_get", "worksheets", "worksheet"})
+
+    def __init__(self, spreadsheet, take_token):
+        self._spreadsheet = spreadsheet
+        self._take_token = take_token
+
+    def __getattr__(self, name):
+        attr = getattr(self._spreadsheet, name)
+        if name not in self._REQUESTS:
+            return attr
+
+        def request(*args, **kwargs):
+            self._take_token()
+            return attr(*args, **kwargs)
+
+        return request
+
+
+class SheetsFetcher:
+    """
+    Every Sheets API call for a connection goes through here:
+
+    - identical requests already in flight are joined, not repeated (single-flight);
+    - each API request takes a token from the read-quota bucket first
+      (a cached sheet layout costs nothing, a layout re-read costs one);
+    - 429s are retried with exponential backoff and full jitter
+      (Retry-After wins when the API sends one).
+
+    Counters (also reported as timing counters, prefixed "sheets."):
+    calls (attempts), requests (API requests), saved, rate_limited,
+    retries, quota_wait_ms, backoff_ms.
+    """
+
+    def __init__(self, connection, reads_per_minute=READS_PER_MINUTE, burst=10,
+                 max_retries=5, backoff=1.0, max_backoff=32.0, sleep=time.sleep):
+        self.connection = connection
+        self.bucket = TokenBucket(reads_per_minute / 60, burst, sleep=sleep)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self._flight = SingleFlight()
+        self._stats_lock = threading.Lock()
+        self._stats = Counter()
+
+    def _count(self, name, n=1):
+        with self._stats_lock:
+            self._stats[name] += n
+        timing.count(f"sheets.{name}", n)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _backoff_delay(self, attempt, exc):
+        retry_after = _retry_after(exc)
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _take_token(self):
+        self._count("quota_wait_ms", round(self.bucket.acquire() * 1000))
+        self._count("requests")
+
+    def _call(self, fn):
+        attempt = 0
+        while True:
+            self._count("calls")
+            try:
+                return self.connection.run(lambda spreadsheet: fn(_MeteredSpreadsheet(spreadsheet, self._take_token)))
+            except Exception as exc:
+                if not _is_rate_limited(exc):
+                    raise
+                self._count("rate_limited")
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt, exc)
+            self._count("retries")
+            self._count("backoff_ms", round(delay * 1000))
+            self._sleep(delay)
+            attempt += 1
+
+    def fetch(self, key, fn):
+        """
+        fn(spreadsheet) through single-flight, quota and retries; same key ->
+        shared result. Every API request fn makes takes one quota token.
+        """
+        result, shared = self._flight.do(key, lambda: self._call(fn))
+        if shared:
+            self._count("saved")
+        return result
+
+    def fetch_all_sections(self, sheet_names=None, cell_range=None):
+        """fetch_all_sections() with every guard above; concurrent identical loads share one call."""
+        names = tuple(sheet_names) if sheet_names is not None else None
+        return self.fetch(
+            ("sections", names, cell_range),
+            lambda spreadsheet: fetch_all_sections(spreadsheet, names, cell_range),
+        )
+
+
+# =========================================================
+# 🔄 Stale-While-Revalidate Cache
+# =========================================================
+class SheetsCache:
+    """
+    Process-wide cache of the latest Google Sheets frames ({section: DataFrame}).
+
+    Readers get whatever is cached right now (possibly stale, possibly
+    nothing) and never wait on the API; refresh_async() fetches on a
+    background thread and swaps the result in for every session at once.
+    """
+
+    def __init__(self, max_age=3600, retry_after=60):
+        self.max_age = max_age
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._frames = {}
+        self._fetched_at = None
+        self._thread = None
+        self._error = None
+        self._error_at = None
+
+    def get(self, section):
+        """(DataFrame or None, fetched_at epoch seconds or None)."""
+        with self._lock:
+            return self._frames.get(section), self._fetched_at
+
+    @property
+    def fetched_at(self):
+        return self._fetched_at
+
+    @property
+    def is_fresh(self) -> bool:
+        fetched_at = self._fetched_at
+        return fetched_at is not None and time.time() - fetched_at < self.max_age
+
+    @property
+    def pending(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    @property
+    def last_error(self):
+        return self._error
+
+    def refresh_async(self, loader) -> bool:
+        """
+        Start loader() (-> {section: DataFrame}) on a daemon thread unless one
+        is already running or the last attempt failed < retry_after seconds ago.
+        Returns True if a refresh is (now) in flight.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            if self._error_at is not None and time.time() - self._error_at < self.retry_after:
+                return False
+            self._thread = threading.Thread(target=self._run, args=(loader,), daemon=True)
+            self._thread.start()
+            return True
+
+    def _run(self, loader):
+        try:
+            frames = loader()
+        except Exception as exc:
+            with self._lock:
+                self._error, self._error_at = exc, time.time()
+            return
+        with self._lock:
+            self._frames = dict(frames)
+            self._fetched_at = time.time()
+            self._error = self._error_at = None
@@ -0,0 +1,145 @@
+# =========================================================
+# 📦 Compiled Schedule Snapshot
+# =========================================================
+# Every CSV in csv_data/ is parsed once into a single typed frame (dates
+# already parsed, display labels already computed) and pickled next to a
+# manifest of file mtimes and content hashes. track, wave_section and
+# LL_num are stored as categoricals, and rows stay grouped by section so
+# utils/store.py can hand out per-section views. The app loads it once
+# per process, so switching sections is a dictionary lookup.
+#
+# Build it ahead of time with:  python -m utils.snapshot
+# =========================================================
+import hashlib
+import os
+import pickle
+from datetime import datetime
+
+import pandas as pd
+
+from functions import parse_schedule_dates, add_ordinal_suffix
+
+CSV_DIR = "csv_data"
+SNAPSHOT_PATH = os.path.join(CSV_DIR, ".schedule_snapshot.pkl")
+SNAPSHOT_VERSION = 3
+CATEGORICAL_COLUMNS = ("track", "wave_section", "LL_num")
+
+
+# =========================================================
+# 🔎 Change detection
+# =========================================================
+def _csv_names(csv_dir=CSV_DIR):
+    return sorted(f[:-len(".csv")] for f in os.listdir(csv_dir) if f.endswith(".csv"))
+
+
+def _file_hash(path):
+    with open(path, "rb") as fh:
+        return hashlib.sha256(fh.read()).hexdigest()
+
+
+def csv_fingerprint(csv_dir=CSV_DIR):
+    """
+    Cheap fingerprint of the CSV tree: (name, mtime_ns, size) per file.
+    Only stats the files, so it is safe to call on every rerun.
+    """
+    out = []
+    for name in _csv_names(csv_dir):
+        st_ = os.stat(os.path.join(csv_dir, f"{name}.csv"))
+        out.append((name, st_.st_mtime_ns, st_.st_size))
+    return tuple(out)
+
+
+def _is_fresh(snapshot, csv_dir):
+    """True if the snapshot still matches every CSV (mtime first, hash as fallback)."""
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("year") != datetime.now().year:
+        return False
+
+    files = snapshot.get("files", {})
+    current = csv_fingerprint(csv_dir)
+    if [name for name, _, _ in current] != sorted(files):
+        return False
+
+    for name, mtime_ns, size in current:
+        entry = files[name]
+        if entry["mtime_ns"] == mtime_ns and entry["size"] == size:
+            continue
+        # touched but maybe not changed (e.g. fresh checkout) -> compare content
+        if entry["sha256"] != _file_hash(os.path.join(csv_dir, f"{name}.csv")):
+            return False
+        entry["mtime_ns"], entry["size"] = mtime_ns, size
+    return True
+
+
+# =========================================================
+# 🏗️ Build / Load
+# =========================================================
+def _load_section_csv(csv_path, name):
+    df = pd.read_csv(csv_path)
+    df["section"] = name
+    df["date"] = parse_schedule_dates(df["date"])
+    df["date_display"] = df["date"].apply(lambda x: add_ordinal_suffix(x))
+    return df
+
+
+def compact_schedule(data):
+    """Repeated labels -> categoricals (a few codes per row instead of one str object each)."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in data.columns:
+            data[col] = data[col].astype("category")
+    return data
+
+
+def build_snapshot(csv_dir=CSV_DIR, path=SNAPSHOT_PATH):
+    """Parse every section CSV into one frame and write the snapshot to `path`."""
+    frames = []
+    files = {}
+    for name in _csv_names(csv_dir):
+        csv_path = os.path.join(csv_dir, f"{name}.csv")
+        st_ = os.stat(csv_path)
+        frames.append(_load_section_csv(csv_path, name))
+        files[name] = {
+            "mtime_ns": st_.st_mtime_ns,
+            "size": st_.st_size,
+            "sha256": _file_hash(csv_path),
+        }
+
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "year": datetime.now().year,
+        "files": files,
+        "data": compact_schedule(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame(),
+    }
+
+    # write-then-rename so a concurrent reader never sees a half-written file
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            pickle.dump(snapshot, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # read-only deploys still get an in-memory snapshot
+        pass
+    return snapshot
+
+
+def load_snapshot(csv_dir=CSV_DIR, path=SNAPSHOT_PATH):
+    """Load the snapshot from disk, rebuilding it if missing or stale."""
+    try:
+        with open(path, "rb") as fh:
+            snapshot = pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return build_snapshot(csv_dir, path)
+
+    if not isinstance(snapshot, dict) or not _is_fresh(snapshot, csv_dir):
+        return build_snapshot(csv_dir, path)
+    return snapshot
+
+
+def source_hashes(snapshot):
+    """{section name: sha256 of its CSV} — stable keys for anything derived from a section."""
+    return {name: entry["sha256"] for name, entry in snapshot["files"].items()}
+
+
+if __name__ == "__main__":
+    snap = build_snapshot()
+    print(f"✅ Compiled {len(snap['files'])} sections ({len(snap['data'])} rows) into {SNAPSHOT_PATH}")
@@ -0,0 +1,73 @@
+# =========================================================
+# 🗄️ Shared Schedule Store
+# =========================================================
+# One read-only frame holding every local section, shared by all
+# sessions (the app keeps it in st.cache_resource). Rows are grouped by
+# section, so a section is a row slice of the shared columns (a view,
+# not a copy). Each lookup returns a new frame object over those same
+# arrays, so no two sessions ever hold the same mutable object.
+#
+# The app turns on pandas Copy-on-Write, so code that modifies a section
+# frame gets its own copy at that moment and never writes through to the
+# shared data.
+# =========================================================
+import numpy as np
+import pandas as pd
+
+from functions import MILESTONE_DUE_COLUMN, milestone_due_dates
+from utils.snapshot import source_hashes
+
+
+class ScheduleStore:
+    """Every local section in one compact frame; store[name] is a zero-copy view of its rows."""
+
+    def __init__(self, snapshot):
+        data = snapshot["data"]
+        if not data.empty and not data["section"].is_monotonic_increasing:
+            data = data.sort_values("section", kind="stable", ignore_index=True)
+        if not data.empty:
+            # due dates once per process; announcements and reminders just read the column
+            data = data.assign(**{MILESTONE_DUE_COLUMN: milestone_due_dates(data)})
+        self.data = data
+        self.hashes = source_hashes(snapshot)
+        self._ranges = {}
+        if data.empty:
+            return
+
+        sections = data["section"].to_numpy()
+        bounds = np.flatnonzero(sections[1:] != sections[:-1]) + 1
+        starts = np.concatenate([[0], bounds])
+        stops = np.concatenate([bounds, [len(data)]])
+        for start, stop in zip(starts, stops):
+            self._ranges[sections[start]] = (int(start), int(stop))
+
+    @property
+    def names(self):
+        return list(self._ranges)
+
+    def __contains__(self, name):
+        return name in self._ranges
+
+    def __getitem__(self, name):
+        """A section's rows as a fresh frame over the shared arrays (index 0..n-1)."""
+        start, stop = self._ranges[name]
+        view = self.data.iloc[start:stop]
+        view.index = pd.RangeIndex(stop - start)
+        return view
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def frame(self, names):
+        """Consolidated frame of several sections (in `names` order), one take from the shared data."""
+        positions = [np.arange(*self._ranges[name]) for name in names if name in self._ranges]
+        if not positions:
+            return self.data.iloc[:0]
+        return self.data.take(np.concatenate(positions)).reset_index(drop=True)
+
+    def memory_usage(self) -> int:
+        """Bytes held by the shared frame (deep, including strings)."""
+        return int(self.data.memory_usage(deep=True).sum())
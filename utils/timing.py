@@ -0,0 +1,132 @@
+# =========================================================
+# ⏱️ Per-Rerun Timing
+# =========================================================
+# Lightweight stage timers for one Streamlit rerun:
+#
+#   timing.start_run(section=...)
+#   with timing.stage("load"): ...
+#   @timing.timed("parse") on library functions
+#   run = timing.finish_run()   # -> one JSON log line + data for the debug panel
+#
+# Timings are kept per thread (each session's script runs on its own
+# thread), so @timed functions called outside a run — background fetches,
+# the CLI, benchmarks — cost two perf_counter() calls and record nothing.
+# Counters (cache hits/misses, ...) are process-wide.
+# =========================================================
+import functools
+import json
+import logging
+import threading
+import time
+from collections import Counter
+
+logger = logging.getLogger("instructor_hub.timing")
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_local = threading.local()
+_counters = Counter()
+_counters_lock = threading.Lock()
+
+
+class Run:
+    """Stages recorded during one rerun: [(name, depth, milliseconds)] in start order."""
+
+    def __init__(self, **context):
+        self.context = context
+        self.stages = []
+        self.depth = 0
+        self.started = time.perf_counter()
+        self.total_ms = None
+
+    def as_dict(self):
+        totals = {}
+        for name, depth, ms in self.stages:
+            totals[name] = round(totals.get(name, 0.0) + ms, 3)
+        return {
+            "event": "rerun",
+            **self.context,
+            "total_ms": self.total_ms,
+            "stages": totals,
+            "counters": counters(),
+        }
+
+
+def start_run(**context) -> Run:
+    """Begin timing a rerun on this thread (replaces any unfinished run)."""
+    _local.run = Run(**context)
+    return _local.run
+
+
+def current_run():
+    return getattr(_local, "run", None)
+
+
+def finish_run(log=True):
+    """Close this thread's run, emit it as a JSON log line and return it (None if no run)."""
+    run = current_run()
+    if run is None:
+        return None
+    _local.run = None
+    run.total_ms = round((time.perf_counter() - run.started) * 1000, 3)
+    if log:
+        logger.info(json.dumps(run.as_dict(), default=str))
+    return run
+
+
+class stage:
+    """Context manager timing one named stage of the current run (no-op without a run)."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._run = current_run()
+        if self._run is not None:
+            self._slot = len(self._run.stages)
+            self._run.stages.append((self.name, self._run.depth, 0.0))
+            self._run.depth += 1
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self._run is not None:
+            ms = (time.perf_counter() - self._start) * 1000
+            self._run.depth -= 1
+            self._run.stages[self._slot] = (self.name, self._run.depth, ms)
+        return False
+
+
+def timed(name=None):
+    """Decorator: time every call of the function as a stage (defaults to its name)."""
+
+    def decorate(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if current_run() is None:
+                return fn(*args, **kwargs)
+            with stage(label):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# -------------------------------
+# 🔢 Process-wide counters
+# -------------------------------
+def count(name, n=1):
+    with _counters_lock:
+        _counters[name] += n
+
+
+def counters():
+    with _counters_lock:
+        return dict(_counters)